@@ -27,9 +27,43 @@ Usage:
 """
 
 from __future__ import annotations
-from typing import Any, Generator
+from typing import Any, Callable, Generator, Hashable, Iterable
 from types import MappingProxyType
-from copy import deepcopy
+from copy import copy
+from struct import pack
+from threading import Lock
+from weakref import WeakValueDictionary
+
+# Integer type codes used in the precomputed per-class field tables.
+# Dispatching on a small int is cheaper than comparing type strings.
+_BOOL, _UINT, _INT, _BITDICT = range(4)
+_TYPE_CODES: dict[str, int] = {
+    "bool": _BOOL,
+    "uint": _UINT,
+    "int": _INT,
+    "bitdict": _BITDICT,
+}
+
+# struct format codes of the unsigned integer record sizes it can pack natively.
+_STRUCT_CODES: dict[int, str] = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+# Marks a missing key in dict.get() lookups where None is a possible value.
+_MISSING = object()
+
+# Keys every property configuration must define.
+_REQUIRED_KEYS = frozenset(("start", "width", "type"))
+
+# Property types: all of them, those with an integer default and those that
+# may select a subtype.
+_VALID_TYPES = frozenset(_TYPE_CODES)
+_NUMERIC_TYPES = frozenset(("uint", "int"))
+_SELECTOR_TYPES = frozenset(("bool", "uint"))
+
+# Classes created by bitdict_factory keyed by a canonical form of the
+# (config, name, title) arguments so identical layouts are only built once.
+# Entries go away with the last reference to their class.
+_FACTORY_CACHE: WeakValueDictionary[Hashable, type] = WeakValueDictionary()
+_FACTORY_LOCK = Lock()
 
 
 def _calculate_total_width(cfg) -> int:
@@ -63,6 +97,7 @@ def _validate_property_config(
     It ensures that all required keys are present, that property names
     are valid identifiers, that bit fields do not overlap, and that
     default values are within the allowed range for the data type.
+    Overlaps are detected in the same pass over the properties.
 
     Args:
         prop_config_top (dict): The top-level configuration dictionary.
@@ -71,10 +106,11 @@ def _validate_property_config(
         ValueError: If the configuration is invalid.
         TypeError: If the config is not a dictionary.
     """
+    used_bits = 0
     for prop_name, prop_config in prop_config_top.items():
         _validate_basic_properties(prop_name, prop_config)
+        used_bits = _claim_bits(prop_config, used_bits)
         _validate_default_values(prop_name, prop_config)
-        _validate_valid_key(prop_name, prop_config)
 
         if prop_config["type"] == "bitdict":
             _validate_bitdict_properties(
@@ -99,54 +135,34 @@ def _validate_basic_properties(prop_name: str, prop_config: dict[str, Any]) -> N
             or if the type is "bool" and the width is not 1.
         TypeError: If the property configuration is not a dictionary or MappingProxyType.
     """
-    _validate_property_name(prop_name)
-    _validate_config_type_and_keys(prop_config)
-    _validate_start_and_width(prop_config)
-    _validate_type(prop_config)
-    _validate_valid_key(prop_name, prop_config)
-    _validate_description(prop_config)
-
-
-def _validate_description(prop_config: dict[str, Any]) -> None:
-    """Validates the description key in the property configuration."""
-    if "description" in prop_config and not isinstance(prop_config["description"], str):
-        raise ValueError("Description must be a string")
-
-
-def _validate_property_name(prop_name: str) -> None:
-    """Validates that the property name is a valid identifier."""
+    # The individual checks are fused so that each key is looked up once.
     if not isinstance(prop_name, str) or not prop_name.isidentifier():
         raise ValueError(f"Invalid property name: {prop_name}")
-
-
-def _validate_config_type_and_keys(prop_config: dict[str, Any]) -> None:
-    """Validates the type and required keys of the property configuration."""
-    required_keys = {"start", "width", "type"}
     if not isinstance(prop_config, (dict, MappingProxyType)):
         raise TypeError(
             "Property configuration must be a dictionary or MappingProxyType"
         )
-    if not required_keys.issubset(prop_config):
-        missing_keys = required_keys - set(prop_config)
+    if not _REQUIRED_KEYS <= prop_config.keys():
+        missing_keys = set(_REQUIRED_KEYS.difference(prop_config))
         raise ValueError(f"Missing required keys in property config: {missing_keys}")
 
-
-def _validate_start_and_width(prop_config: dict[str, Any]) -> None:
-    """Validates the start and width values in the property configuration."""
-    if not isinstance(prop_config["start"], int) or prop_config["start"] < 0:
-        raise ValueError(f"Invalid start value: {prop_config['start']}")
-    if not isinstance(prop_config["width"], int) or prop_config["width"] <= 0:
-        raise ValueError(f"Invalid width value: {prop_config['width']}")
-
-
-def _validate_type(prop_config: dict[str, Any]) -> None:
-    """Validates the type value in the property configuration."""
-    valid_types = {"bool", "uint", "int", "bitdict"}
-    if prop_config["type"] not in valid_types:
-        raise ValueError(f"Invalid type value: {prop_config['type']}")
-    if prop_config["type"] == "bool" and prop_config["width"] != 1:
+    start = prop_config["start"]
+    if not isinstance(start, int) or start < 0:
+        raise ValueError(f"Invalid start value: {start}")
+    width = prop_config["width"]
+    if not isinstance(width, int) or width <= 0:
+        raise ValueError(f"Invalid width value: {width}")
+    prop_type = prop_config["type"]
+    if prop_type not in _VALID_TYPES:
+        raise ValueError(f"Invalid type value: {prop_type}")
+    if prop_type == "bool" and width != 1:
         raise ValueError("Boolean properties must have width 1")
 
+    _validate_valid_key(prop_name, prop_config)
+    description = prop_config.get("description", _MISSING)
+    if description is not _MISSING and not isinstance(description, str):
+        raise ValueError("Description must be a string")
+
 
 def _validate_default_values(prop_name: str, prop_config: dict[str, Any]) -> None:
     """Validates and sets default values for properties in a bitfield configuration.
@@ -198,7 +214,7 @@ def _set_missing_defaults(prop_config: dict[str, Any]) -> None:
     prop_type = prop_config["type"]
     if prop_type == "bool":
         prop_config["default"] = False
-    elif prop_type in ("uint", "int"):
+    elif prop_type in _NUMERIC_TYPES:
         prop_config["default"] = 0
 
 
@@ -214,7 +230,7 @@ def _validate_default_value_type(prop_name: str, prop_config: dict[str, Any]) ->
                 f"Invalid default type for property {prop_name}"
                 f" expecting bool: {type(default_value)}"
             )
-    elif prop_type in ("uint", "int"):
+    elif prop_type in _NUMERIC_TYPES:
         if not isinstance(default_value, int):
             raise TypeError(
                 f"Invalid default type for property {prop_name}"
@@ -266,17 +282,14 @@ def _validate_bitdict_properties(
             - The selector property's width is greater than 16.
             - The 'subtype' list is empty.
     """
-    if "subtype" not in prop_config or not isinstance(prop_config["subtype"], list):
+    if not isinstance(prop_config.get("subtype"), list):
         raise ValueError("'bitdict' type requires a 'subtype' list")
-    if "selector" not in prop_config or not isinstance(prop_config["selector"], str):
+    selector = prop_config.get("selector")
+    if not isinstance(selector, str):
         raise ValueError("'bitdict' type requires a 'selector' field")
-    selector = prop_config["selector"]
     if selector not in prop_config_top:
         raise ValueError(f"Invalid selector property: {selector}")
-    if prop_config_top[selector]["type"] not in (
-        "bool",
-        "uint",
-    ):
+    if prop_config_top[selector]["type"] not in _SELECTOR_TYPES:
         raise ValueError("Selector property must be of type 'bool' or 'uint'")
     if prop_config_top[selector]["width"] > 16:
         raise ValueError("Selector property width must be <= 16 (65536 subtypes)")
@@ -290,14 +303,13 @@ def _validate_bitdict_properties(
         )
 
     for idx, sub_config in enumerate(prop_config["subtype"]):
-        # Recursively validate sub-configurations
+        # Recursively validate sub-configurations. The name and title do not
+        # depend on the index so identical subtypes share one cached class.
         subtypes.setdefault(prop_name, []).append(
             None
             if sub_config is None
             else bitdict_factory(
-                sub_config,
-                name=f"prop_name{idx}",
-                title=f"{prop_name}: {selector} = {idx}",
+                sub_config, name=prop_name, title=f"{prop_name}: {selector}"
             )
         )  # We can use the factory recursively
         if sub_config is None and _is_valid_value(idx, prop_config_top[selector]):
@@ -314,10 +326,10 @@ def _validate_valid_key(prop_name: str, prop_config: dict[str, Any]) -> None:
             raise ValueError(f"'valid' key not allowed for {prop_config['type']} type")
         return
 
-    if "valid" not in prop_config:
+    valid_config = prop_config.get("valid", _MISSING)
+    if valid_config is _MISSING:
         return
 
-    valid_config = prop_config["valid"]
     if not isinstance(valid_config, dict):
         raise ValueError(f"'valid' must be a dictionary for property {prop_name}")
 
@@ -329,114 +341,684 @@ def _validate_valid_key(prop_name: str, prop_config: dict[str, Any]) -> None:
             f"'valid' dictionary must contain 'value' or 'range' for property {prop_name}"
         )
 
-    _validate_valid_value(prop_name, prop_config, valid_config)
-    _validate_valid_range(prop_name, prop_config, valid_config)
+    bounds = _value_bounds(prop_config)
+    _validate_valid_value(prop_name, bounds, valid_config)
+    _validate_valid_range(prop_name, bounds, valid_config)
 
 
 def _validate_valid_value(
-    prop_name: str, prop_config: dict[str, Any], valid_config: dict[str, Any]
+    prop_name: str, bounds: tuple[int, int], valid_config: dict[str, Any]
 ) -> None:
     """Validates the 'value' key within the 'valid' configuration."""
-    if "value" not in valid_config:
+    values = valid_config.get("value", _MISSING)
+    if values is _MISSING:
         return
 
-    if not isinstance(valid_config["value"], set):
+    if not isinstance(values, set):
         raise ValueError(
             f"'value' in 'valid' dictionary must be a set for property {prop_name}"
         )
-    if not valid_config["value"]:
+    if not values:
         raise ValueError(
             f"'value' set in 'valid' dictionary cannot be empty for property {prop_name}"
         )
-    for val in valid_config["value"]:
+    low, high = bounds
+    for val in values:
         if not isinstance(val, (int, bool)):
             raise ValueError(
                 f"Invalid value type in 'valid' set for property {prop_name}: {val}"
             )
-        if not _is_value_in_range(val, prop_config):
+        if not low <= val < high:
             raise ValueError(f"Value {val} out of range for property {prop_name}")
 
 
 def _validate_valid_range(
-    prop_name: str, prop_config: dict[str, Any], valid_config: dict[str, Any]
+    prop_name: str, bounds: tuple[int, int], valid_config: dict[str, Any]
 ) -> None:
     """Validates the 'range' key within the 'valid' configuration."""
-    if "range" not in valid_config:
+    ranges = valid_config.get("range", _MISSING)
+    if ranges is _MISSING:
         return
 
-    if not isinstance(valid_config["range"], list):
+    if not isinstance(ranges, list):
         raise ValueError(
             f"'range' in 'valid' dictionary must be a list for property {prop_name}"
         )
-    if not valid_config["range"]:
+    if not ranges:
         raise ValueError(
             f"'range' list in 'valid' dictionary cannot be empty for property {prop_name}"
         )
-    for r in valid_config["range"]:
+    low, high = bounds
+    for r in ranges:
         if not isinstance(r, tuple) or not 1 <= len(r) <= 3:
             raise ValueError(
                 f"Invalid range tuple in 'valid' list for property {prop_name}: {r}"
             )
-        for val in range(*r):
-            if not _is_value_in_range(val, prop_config):
-                raise ValueError(f"Value {val} out of range for property {prop_name}")
+        # A range is monotonic so it is in bounds if both of its ends are.
+        values = range(*r)
+        if values and not (low <= values[0] < high and low <= values[-1] < high):
+            val = next(v for v in values if not low <= v < high)
+            raise ValueError(f"Value {val} out of range for property {prop_name}")
 
 
 def _is_valid_value(value: int | bool, prop_config: dict[str, Any]) -> bool:
     """Checks if a value is valid according to the 'valid'
     key in the property configuration."""
-    if "valid" not in prop_config:
+    valid_config = prop_config.get("valid")
+    if valid_config is None:
         return True
 
-    valid_config = prop_config["valid"]
-    if "value" in valid_config and value in valid_config["value"]:
+    values = valid_config.get("value")
+    if values is not None and value in values:
         return True
 
-    if "range" in valid_config:
-        for r in valid_config["range"]:
-            if value in range(*r):
-                return True
+    for r in valid_config.get("range", ()):
+        start, stop, step = _range_bounds(r)
+        in_bounds = start <= value < stop if step > 0 else stop < value <= start
+        if in_bounds and (value - start) % step == 0:
+            return True
 
     return False
 
 
-def _is_value_in_range(value: int | bool, prop_config: dict[str, Any]) -> bool:
-    """Checks if a value is within the allowed range for a property."""
+def _range_bounds(r: tuple[int, ...]) -> tuple[int, int, int]:
+    """Expands a 'valid' range tuple to (start, stop, step) as range() does.
+    Membership can then be tested arithmetically without a range object."""
+    if len(r) == 1:
+        return 0, r[0], 1
+    if len(r) == 2:
+        return r[0], r[1], 1
+    return r[0], r[1], r[2]
+
+
+def _valid_condition(prop_name: str, valid_config: dict[str, Any]) -> str:
+    """
+    Generates the condition that a 'valid' configuration accepts the value `v`.
+
+    Ranges become literal comparisons. A value set is looked up as
+    `_values[prop_name]` in the namespace the condition is compiled in.
+
+    Args:
+        prop_name (str): The name of the property.
+        valid_config (dict): The 'valid' configuration of the property.
+
+    Returns:
+        str: A Python expression.
+    """
+    terms = []
+    if "value" in valid_config:
+        terms.append(f"v in _values[{prop_name!r}]")
+    for r in valid_config.get("range", ()):
+        start, stop, step = _range_bounds(r)
+        term = f"{start} <= v < {stop}" if step > 0 else f"{stop} < v <= {start}"
+        if step != 1:
+            term = f"({term} and (v - {start}) % {step} == 0)"
+        terms.append(term)
+    return " or ".join(terms) or "False"
+
+
+def _value_bounds(prop_config: dict[str, Any]) -> tuple[int, int]:
+    """Returns the (inclusive low, exclusive high) bounds of a property's values.
+    Computed once per property so that checking many values does no shifts."""
     if prop_config["type"] == "bool":
-        return value in (True, False)
+        return 0, 2
     width = prop_config["width"]
     if prop_config["type"] == "uint":
-        return 0 <= value < (1 << width)
+        return 0, 1 << width
     assert prop_config["type"] == "int", "Unexpected property type"
-    return -(1 << (width - 1)) <= value < (1 << (width - 1))
+    return -(1 << (width - 1)), 1 << (width - 1)
 
 
-def _check_overlapping(cfg) -> None:
+def _copy_config(
+    cfg: dict[str, Any], subtypes: dict[str, list[type | None]]
+) -> dict[str, Any]:
     """
-    Checks for overlapping bit field definitions.
+    Creates the read-only class copy of a validated configuration.
 
-    This helper function ensures that no two bit fields in the
-    configuration overlap.
+    Only this level of the configuration is copied. The 'subtype' lists refer to
+    the read-only configurations of the already created subtype classes rather
+    than deep copies of them, so each nested configuration is copied exactly once.
 
     Args:
-        cfg (dict): The configuration dictionary.
+        cfg (dict): The validated configuration dictionary.
+        subtypes (dict): The subtype classes created during validation.
+
+    Returns:
+        dict: The copied configuration, to be exposed through a read-only view.
+    """
+    frozen: dict[str, Any] = {}
+    for prop_name, prop_config in cfg.items():
+        prop_copy = dict(prop_config)
+        if "valid" in prop_copy:
+            prop_copy["valid"] = {k: copy(v) for k, v in prop_copy["valid"].items()}
+        if prop_copy["type"] == "bitdict":
+            prop_copy["subtype"] = [
+                None if subtype is None else subtype.get_config()  # type: ignore
+                for subtype in subtypes[prop_name]
+            ]
+        frozen[prop_name] = prop_copy
+    return frozen
+
+
+def _build_field_table(cfg) -> dict[str, tuple[int, int, int, int, int]]:
+    """
+    Builds the per-property access table for a validated configuration.
+
+    Each property maps to a `(start, width, mask, sign_bit, type_code)` tuple so
+    that item access is a single dictionary lookup and tuple unpack rather than
+    several configuration lookups and shifts.
+
+    Args:
+        cfg (dict): The validated configuration dictionary.
+
+    Returns:
+        dict: The property name to access tuple mapping.
+    """
+    return {
+        prop_name: (
+            prop_config["start"],
+            prop_config["width"],
+            (1 << prop_config["width"]) - 1,
+            1 << (prop_config["width"] - 1),
+            _TYPE_CODES[prop_config["type"]],
+        )
+        for prop_name, prop_config in cfg.items()
+    }
+
+
+def _getter_source(
+    prop_name: str,
+    field: tuple[int, int, int, int, int],
+    selector_field: tuple[int, int, int, int, int] | None,
+    sub_slot: tuple[int, int] | None = None,
+) -> str:
+    """
+    Generates the source of a getter specialized for a single property.
+
+    The start, mask and sign bit of the property are baked into the function
+    as literals so that a read is a single shift and mask.
+
+    Args:
+        prop_name (str): The name of the property.
+        field (tuple): The `(start, width, mask, sign_bit, type_code)` of the property.
+        selector_field (tuple | None): The access tuple of the selector property
+            for 'bitdict' types, None otherwise.
+        sub_slot (tuple | None): The `(base offset, count)` of a 'bitdict'
+            property in the flat sub-bitdict list, None otherwise.
+
+    Returns:
+        str: The source of a function named `_get_<prop_name>`.
 
     Raises:
-        ValueError: If any bit fields overlap.
+        AssertionError: If the type code is unknown.
     """
-    used_bits = set()
-    for _, prop_config in cfg.items():
-        for i in range(
-            prop_config["start"], prop_config["start"] + prop_config["width"]
-        ):
-            if i in used_bits:
+    start, _, mask, sign_bit, type_code = field
+    extract = f"(self._value >> {start}) & {mask}"
+    lines = [f"def _get_{prop_name}(self):"]
+    if type_code == _BOOL:
+        # A single bit needs no shift: test it in place.
+        lines.append(f"    return self._value & {1 << start} != 0")
+    elif type_code == _UINT:
+        lines.append(f"    return {extract}")
+    elif type_code == _INT:
+        # Branchless sign extension: flipping the sign bit and subtracting it
+        # maps the upper half of the unsigned range onto the negative values.
+        lines.append(f"    return (({extract}) ^ {sign_bit}) - {sign_bit}")
+    elif type_code == _BITDICT:
+        assert selector_field is not None, "Selector not defined for bitdict type"
+        assert sub_slot is not None, "Sub-bitdict slot not defined for bitdict type"
+        sel_start, _, sel_mask, _, _ = selector_field
+        base, count = sub_slot
+        # An existing sub-BitDict is returned straight from its list slot.
+        guard = "subs is not None"
+        if count <= sel_mask:
+            # Not every selector value has a subtype.
+            guard += f" and selector < {count}"
+        lines += [
+            f"    selector = (self._value >> {sel_start}) & {sel_mask}",
+            "    subs = self._subs",
+            f"    if {guard}:",
+            f"        sub = subs[{base} + selector]",
+            "        if sub is not None:",
+            "            return sub",
+            f"    return self._get_subbitdict({prop_name!r}, selector)",
+        ]
+    else:
+        assert False, f"Unknown property type code: {type_code}"
+    return "\n".join(lines) + "\n"
+
+
+def _setter_source(  # pylint: disable=too-many-locals
+    prop_name: str,
+    field: tuple[int, int, int, int, int],
+    selector_field: tuple[int, int, int, int, int] | None,
+    child: tuple[str, tuple[int, int, int, int, int]] | None,
+) -> str:
+    """
+    Generates the source of a setter specialized for a single property.
+
+    Type and range checks, the selector update of a dependent 'bitdict' property
+    and the write into the underlying integer all use literal constants.
+
+    Args:
+        prop_name (str): The name of the property.
+        field (tuple): The `(start, width, mask, sign_bit, type_code)` of the property.
+        selector_field (tuple | None): The access tuple of the selector property
+            for 'bitdict' types, None otherwise.
+        child (tuple | None): The name and access tuple of the 'bitdict' property
+            this property selects for, None if it is not a selector.
+
+    Returns:
+        str: The source of a function named `_set_<prop_name>`.
+
+    Raises:
+        AssertionError: If the type code is unknown.
+    """
+    start, _, mask, sign_bit, type_code = field
+    lines = [f"def _set_{prop_name}(self, value):"]
+    if type_code == _BOOL:
+        lines += [
+            "    if not isinstance(value, (bool, int)):",
+            "        raise TypeError("
+            f"\"Expected boolean or integer value for property '{prop_name}'\")",
+            "    value = 1 if value else 0",
+        ]
+    elif type_code in (_UINT, _INT):
+        low, high = (0, mask) if type_code == _UINT else (-sign_bit, sign_bit - 1)
+        lines += [
+            "    if not isinstance(value, int):",
+            f"        raise TypeError(\"Expected integer value for property '{prop_name}'\")",
+            f"    if not {low} <= value <= {high}:",
+            "        raise ValueError("
+            f"f\"Value {{value}} out of range for property '{prop_name}'\")",
+        ]
+    elif type_code == _BITDICT:
+        assert selector_field is not None, "Selector not defined for bitdict type"
+        sel_start, _, sel_mask, _, _ = selector_field
+        lines += [
+            f"    bd = self._get_subbitdict({prop_name!r},"
+            f" (self._value >> {sel_start}) & {sel_mask})",
+            "    bd.set(value)",
+            "    value = bd._value",
+        ]
+    else:
+        assert False, f"Unknown property type code: {type_code}"
+
+    # Negative 'int' values and sub-bitdict values may carry bits beyond the
+    # property width. Other values were range checked above and need no mask.
+    insert = f"(value & {mask})" if type_code in (_INT, _BITDICT) else "value"
+
+    # A selector change swaps in the newly selected sub-bitdict value. The
+    # previously selected one is kept so that its value can be swapped back.
+    # Both fields are written with a single masked update.
+    if child is not None:
+        child_name, (child_start, _, child_mask, _, _) = child
+        lines += [
+            f"    if (self._value >> {start}) & {mask} != value:",
+            f"        self._hold_selected({child_name!r})",
+            f"    bd = self._get_subbitdict({child_name!r}, value)",
+            f"    self._value = (self._value & {~(mask << start | child_mask << child_start)})"
+            f" | ({insert} << {start}) | ((bd._value & {child_mask}) << {child_start})",
+        ]
+    else:
+        lines.append(
+            f"    self._value = (self._value & {~(mask << start)}) | ({insert} << {start})"
+        )
+    lines += [
+        "    if self._ancestors:",
+        "        self._update_parent()",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _set_int_source(
+    total_width: int,
+    bitdict_props: tuple[tuple[str, int, int, int, int], ...],
+    sub_slots: dict[str, tuple[int, int]],
+    nested: frozenset[str],
+    check_subs: bool,
+) -> str:
+    """
+    Generates the source of the integer branch of `set()` for one class.
+
+    The range check and the loading of each sub-bitdict use literal bounds,
+    shifts, masks and sub-bitdict list offsets. Only sub-bitdicts that already
+    exist are loaded; the others take their value from the integer when they
+    are first used, so their fields are range checked by `_check_sub_values`.
+
+    Args:
+        total_width (int): The total width of the BitDict in bits.
+        bitdict_props (tuple): The `(name, start, mask, selector start,
+            selector mask)` of each 'bitdict' property.
+        sub_slots (dict): The `(base offset, count)` of each 'bitdict' property
+            in the flat sub-bitdict list.
+        nested (frozenset): The 'bitdict' properties with a subtype that has
+            sub-bitdicts of its own.
+        check_subs (bool): True if a sub-bitdict field can exceed its subtype.
+
+    Returns:
+        str: The source of a function named `_set_int`.
+    """
+    lines = [
+        "def _set_int(self, value):",
+        # One chained comparison on the success path.
+        f"    if not 0 <= value < {1 << total_width}:",
+        "        if value < 0:",
+        '            raise ValueError(f"Integer must be non-negative, got {value}")',
+        "        raise ValueError(",
+        f'            f"Integer value {{value}} exceeds maximum value for bit width {total_width}"',
+        "        )",
+    ]
+    if check_subs:
+        lines.append("    _check_sub_values(_sub_checks, value)")
+    # Sub-bitdicts selected before a selector change keep their value, as do
+    # the sub-bitdicts nested in them when the property bits change.
+    for prop_name, start, mask, sel_start, sel_mask in bitdict_props:
+        held = sel_mask << sel_start
+        if prop_name in nested:
+            held |= mask << start
+        lines += [
+            f"    if (self._value ^ value) & {held}:",
+            f"        self._hold_selected({prop_name!r})",
+        ]
+    lines.append("    self._value = value")
+    if bitdict_props:
+        lines += ["    subs = self._subs", "    if subs is None:", "        return"]
+    # Must set sub-bitdicts after setting the main value.
+    for prop_name, start, mask, sel_start, sel_mask in bitdict_props:
+        base, count = sub_slots[prop_name]
+        lines.append(f"    selector = (value >> {sel_start}) & {sel_mask}")
+        indent = "    "
+        if count <= sel_mask:
+            # Not every selector value has a subtype.
+            lines.append(f"    if selector < {count}:")
+            indent += "    "
+        lines += [
+            f"{indent}sub = subs[{base} + selector]",
+            f"{indent}if sub is not None:",
+            f"{indent}    sub._set_int((value >> {start}) & {mask})",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def _extract_source(field: tuple[int, int, int, int, int]) -> str:
+    """Generates the expression that decodes a non-bitdict property from `value`.
+    The start, mask and sign bit of the property are literals."""
+    start, _, mask, sign_bit, type_code = field
+    if type_code == _BOOL:
+        return f"value & {1 << start} != 0"
+    if type_code == _UINT:
+        return f"(value >> {start}) & {mask}"
+    assert type_code == _INT, f"Unexpected property type code: {type_code}"
+    return f"(((value >> {start}) & {mask}) ^ {sign_bit}) - {sign_bit}"
+
+
+def _to_tuple_source(
+    fast: dict[str, tuple[int, int, int, int, int]], iter_order: tuple[str, ...]
+) -> str:
+    """
+    Generates the source of `to_tuple()` for one class.
+
+    Every property is decoded in a single tuple display in LSB to MSB order.
+    Sub-bitdicts are reached through `_getters[name]` in the namespace the
+    source is compiled in.
+
+    Args:
+        fast (dict): The property access table from `_build_field_table`.
+        iter_order (tuple): The property names in LSB to MSB order.
+
+    Returns:
+        str: The source of a function named `_to_tuple`.
+    """
+    items = [
+        (
+            f"_getters[{prop_name!r}](self)"
+            if fast[prop_name][4] == _BITDICT
+            else _extract_source(fast[prop_name])
+        )
+        for prop_name in iter_order
+    ]
+    lines = [
+        "def _to_tuple(self):",
+        "    value = self._value",
+        f"    return ({''.join(f'{item}, ' for item in items)})",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _valid_source(
+    fast: dict[str, tuple[int, int, int, int, int]],
+    config: dict[str, Any],
+    selector_of: dict[str, str],
+) -> tuple[str, dict[str, frozenset]]:
+    """
+    Generates the source of `valid()` for one class.
+
+    Properties without a 'valid' key accept every value and are not checked.
+    The others are extracted from the integer with literal shifts and masks and
+    checked with the conditions from `_valid_condition`, so that no range
+    objects are created. Sub-bitdicts are reached through `_getters[name]` in
+    the namespace the source is compiled in.
+
+    Args:
+        fast (dict): The property access table from `_build_field_table`.
+        config (dict): The validated configuration dictionary.
+        selector_of (dict): Maps 'bitdict' properties to their selector property.
+
+    Returns:
+        tuple: The source of a function named `_valid` and the `_values`
+            mapping of property names to their set of valid values.
+    """
+    values = {
+        prop_name: frozenset(prop_config["valid"]["value"])
+        for prop_name, prop_config in config.items()
+        if "value" in prop_config.get("valid", ())
+    }
+    lines = ["def _valid(self):", "    value = self._value"]
+    for prop_name, prop_config in config.items():
+        selector = selector_of.get(prop_name)
+        if selector is not None:
+            if "valid" in config[selector]:
+                sel_start, _, sel_mask, _, _ = fast[selector]
+                lines += [
+                    f"    v = (value >> {sel_start}) & {sel_mask}",
+                    f"    if not ({_valid_condition(selector, config[selector]['valid'])}):",
+                    "        return False",
+                ]
+            lines += [
+                f"    if not _getters[{prop_name!r}](self).valid():",
+                "        return False",
+            ]
+            continue
+        if "valid" not in prop_config:
+            continue
+        lines += [
+            f"    v = {_extract_source(fast[prop_name])}",
+            f"    if not ({_valid_condition(prop_name, prop_config['valid'])}):",
+            "        return False",
+        ]
+    lines.append("    return True")
+    return "\n".join(lines) + "\n", values
+
+
+def _compile_accessor(
+    source: str, fn_name: str, namespace: dict[str, Any] | None = None
+) -> Callable[..., Any]:
+    """Compiles generated accessor source and returns the named function.
+    The optional namespace provides the globals the source refers to."""
+    namespace = {} if namespace is None else namespace
+    exec(  # pylint: disable=exec-used
+        compile(source, f"<bitdict {fn_name}>", "exec"), namespace
+    )
+    return namespace[fn_name]
+
+
+def _generate_accessors(
+    fast: dict[str, tuple[int, int, int, int, int]],
+    selector_of: dict[str, str],
+    bitdict_child_of: dict[str, str],
+    sub_slots: dict[str, tuple[int, int]],
+) -> tuple[dict[str, Callable[..., Any]], dict[str, Callable[..., Any]]]:
+    """
+    Generates the specialized getter and setter for every property.
+
+    Args:
+        fast (dict): The property access table from `_build_field_table`.
+        selector_of (dict): Maps 'bitdict' properties to their selector property.
+        bitdict_child_of (dict): Maps selector properties to their 'bitdict' property.
+        sub_slots (dict): The `(base offset, count)` of each 'bitdict' property
+            in the flat sub-bitdict list.
+
+    Returns:
+        tuple: The property name to getter and property name to setter mappings.
+    """
+    getters: dict[str, Callable[..., Any]] = {}
+    setters: dict[str, Callable[..., Any]] = {}
+    for prop_name, field in fast.items():
+        selector = selector_of.get(prop_name)
+        selector_field = None if selector is None else fast[selector]
+        child_name = bitdict_child_of.get(prop_name)
+        child = None if child_name is None else (child_name, fast[child_name])
+        getters[prop_name] = _compile_accessor(
+            _getter_source(prop_name, field, selector_field, sub_slots.get(prop_name)),
+            f"_get_{prop_name}",
+        )
+        setters[prop_name] = _compile_accessor(
+            _setter_source(prop_name, field, selector_field, child),
+            f"_set_{prop_name}",
+        )
+    return getters, setters
+
+
+def _check_sub_values(
+    sub_checks: tuple[tuple[int, int, int, int, tuple[Any, ...]], ...], value: int
+) -> None:
+    """
+    Checks that each selected sub-bitdict field of a value fits its subtype.
+
+    Sub-bitdicts are created from their field bits when first used, so this
+    raises for a value they could not hold when the value is set instead.
+
+    Args:
+        sub_checks (tuple): The `_sub_checks` of the BitDict class.
+        value (int): An in range integer value of a BitDict of that class.
+
+    Raises:
+        ValueError: If a selected sub-bitdict field, at any depth, exceeds the
+            maximum value for the bit width of its subtype.
+    """
+    # pylint: disable=protected-access
+    for start, mask, sel_start, sel_mask, subtypes in sub_checks:
+        selector = (value >> sel_start) & sel_mask
+        if selector < len(subtypes) and subtypes[selector] is not None:
+            subtype = subtypes[selector]
+            sub_value = (value >> start) & mask
+            if sub_value >= subtype._max_uint:
                 raise ValueError(
-                    f"Overlapping bit definitions: bit {i} is used by multiple properties"
+                    f"Integer value {sub_value} exceeds maximum value for bit"
+                    f" width {subtype._total_width}"
                 )
-            used_bits.add(i)
+            if subtype._sub_checks:
+                _check_sub_values(subtype._sub_checks, sub_value)
+
+
+def _canonical(obj: Any) -> Hashable:
+    """
+    Converts a configuration value into a hashable canonical form.
+
+    Dictionaries become key sorted tuples, lists and tuples become tuples and
+    sets become frozensets. Scalars are tagged with their type so that, for
+    example, a default of `True` does not compare equal to a default of `1`.
+
+    Args:
+        obj (Any): The configuration value.
+
+    Returns:
+        Hashable: The canonical form of the value.
+
+    Raises:
+        TypeError: If the value contains unhashable or unorderable keys or values.
+    """
+    if isinstance(obj, dict):
+        return ("dict", tuple(sorted((k, _canonical(v)) for k, v in obj.items())))
+    if isinstance(obj, (list, tuple)):
+        return (type(obj).__name__, tuple(_canonical(v) for v in obj))
+    if isinstance(obj, set):
+        return ("set", frozenset(_canonical(v) for v in obj))
+    hash(obj)
+    return (type(obj).__name__, obj)
+
+
+def _factory_cache_key(config: dict[str, Any], name: str, title: str) -> Hashable:
+    """Returns the factory cache key for the arguments or None if they cannot be cached."""
+    try:
+        return (_canonical(config), name, title)
+    except TypeError:
+        return None
+
+
+def _cache_class(cls: type, *keys: Hashable) -> type:
+    """Caches a new class under each key that is not None and returns the class
+    to use, which another thread may have cached first."""
+    with _FACTORY_LOCK:
+        for key in keys:
+            if key is not None:
+                cls = _FACTORY_CACHE.setdefault(key, cls)
+    return cls
+
+
+def _apply_normalization(
+    cfg: dict[str, Any], frozen: MappingProxyType[str, Any]
+) -> None:
+    """
+    Adds the keys that validation would have added to a configuration.
 
+    When bitdict_factory returns a cached class the caller's configuration is not
+    validated again. This copies the normalised keys (e.g. 'default') from the
+    cached class configuration so the caller sees the same result either way.
 
-def bitdict_factory(  # pylint: disable=too-many-statements
+    Args:
+        cfg (dict): The caller's configuration dictionary.
+        frozen (MappingProxyType): The configuration of the equivalent cached class.
+    """
+    for prop_name, prop_config in cfg.items():
+        frozen_config = frozen[prop_name]
+        for key, value in frozen_config.items():
+            if key not in prop_config:
+                prop_config[key] = value
+        if prop_config["type"] == "bitdict":
+            for sub_config, frozen_sub in zip(
+                prop_config["subtype"], frozen_config["subtype"]
+            ):
+                if sub_config is not None:
+                    _apply_normalization(sub_config, frozen_sub)
+
+
+def _claim_bits(prop_config: dict[str, Any], used_bits: int) -> int:
+    """
+    Marks the bits of a property as used, checking for overlapping definitions.
+
+    Args:
+        prop_config (dict): The configuration of the property.
+        used_bits (int): A bitmap of the bits used by the properties seen so far.
+
+    Returns:
+        int: The bitmap with the bits of the property added.
+
+    Raises:
+        ValueError: If any bit of the property is already used.
+    """
+    prop_bits = ((1 << prop_config["width"]) - 1) << prop_config["start"]
+    overlap = used_bits & prop_bits
+    if overlap:
+        raise ValueError(
+            f"Overlapping bit definitions: bit {(overlap & -overlap).bit_length() - 1}"
+            " is used by multiple properties"
+        )
+    return used_bits | prop_bits
+
+
+def bitdict_factory(  # pylint: disable=too-many-statements,too-many-locals
     config: dict[str, Any], name: str = "BitDict", title: str = "BitDict"
 ) -> type:
     """
@@ -473,7 +1055,8 @@ def bitdict_factory(  # pylint: disable=too-many-statements
             the markdown documentation with `config_to_markdown`. Defaults to "BitDict".
 
     Returns:
-        type: A new class that represents the bit field structure.
+        type: A class that represents the bit field structure. Calls with an
+            identical configuration, name and title return the same class.
 
     Raises:
         ValueError: If the configuration is invalid (e.g., overlapping
@@ -509,13 +1092,131 @@ def bitdict_factory(  # pylint: disable=too-many-statements
     if not name.isidentifier():
         raise ValueError("Invalid class name")
 
+    # Identical layouts share a class. Sub-configurations are built through
+    # this function too so repeated nested layouts are also only built once.
+    cache_key = _factory_cache_key(config, name, title)
+    with _FACTORY_LOCK:
+        cached = _FACTORY_CACHE.get(cache_key) if cache_key is not None else None
+    if cached is not None:
+        _apply_normalization(config, cached.get_config())  # type: ignore
+        return cached
+
     # Subtype classes are stored in a dictionary for recursive creation.
     subtype_lists: dict[str, list[type | None]] = {}
     _title: str = title
 
     _validate_property_config(config, subtype_lists)  # Initial validation of top level.
-    _check_overlapping(config)
     total_width = _calculate_total_width(config)
+    fast = _build_field_table(config)
+    selector_of = {
+        prop_name: prop_config["selector"]
+        for prop_name, prop_config in config.items()
+        if prop_config["type"] == "bitdict"
+    }
+    bitdict_child_of = {
+        selector: prop_name for prop_name, selector in selector_of.items()
+    }
+    # (base offset, count) of each 'bitdict' property in the flat sub-bitdict list.
+    sub_slots: dict[str, tuple[int, int]] = {}
+    sub_count = 0
+    for prop_name, subtype_list in subtype_lists.items():
+        sub_slots[prop_name] = (sub_count, len(subtype_list))
+        sub_count += len(subtype_list)
+    getters, setters = _generate_accessors(
+        fast, selector_of, bitdict_child_of, sub_slots
+    )
+    # (name, start, mask, selector start, selector mask) of each 'bitdict' property.
+    bitdict_props = tuple(
+        (prop_name, fast[prop_name][0], fast[prop_name][2], fast[sel][0], fast[sel][2])
+        for prop_name, sel in selector_of.items()
+    )
+    # 'bitdict' properties with a subtype that has sub-bitdicts of its own.
+    nested = frozenset(
+        prop_name
+        for prop_name, subtype_list in subtype_lists.items()
+        if any(
+            subtype._bitdict_props  # type: ignore  # pylint: disable=protected-access
+            for subtype in subtype_list
+            if subtype is not None
+        )
+    )
+    # (start, mask, selector start, selector mask, subtypes) of each 'bitdict'
+    # property where the selected subtype may not accept every field value.
+    sub_checks = tuple(
+        (start, mask, sel_start, sel_mask, tuple(subtype_lists[prop_name]))
+        for prop_name, start, mask, sel_start, sel_mask in bitdict_props
+        if any(
+            subtype._max_uint <= mask  # type: ignore  # pylint: disable=protected-access
+            or subtype._sub_checks  # type: ignore  # pylint: disable=protected-access
+            for subtype in subtype_lists[prop_name]
+            if subtype is not None
+        )
+    )
+    # Names reachable from this class under any selector state.
+    all_keys = frozenset(config).union(
+        *(
+            subtype._all_keys  # type: ignore  # pylint: disable=protected-access
+            for subtype_list in subtype_lists.values()
+            for subtype in subtype_list
+            if subtype is not None
+        )
+    )
+    defaults = {
+        prop_name: prop_config["default"]
+        for prop_name, prop_config in config.items()
+        if "default" in prop_config
+    }
+    # The integer value of a BitDict with every property at its default.
+    default_value = 0
+    for prop_name, value in defaults.items():
+        default_value |= (int(value) & fast[prop_name][2]) << fast[prop_name][0]
+    for prop_name, start, mask, sel_start, sel_mask in bitdict_props:
+        subtype_list = subtype_lists[prop_name]
+        selector_value = (default_value >> sel_start) & sel_mask
+        if selector_value < len(subtype_list):
+            subtype: Any = subtype_list[selector_value]
+            if subtype is not None:
+                default_value |= (
+                    subtype._default_value & mask  # pylint: disable=protected-access
+                ) << start
+    # (name, setter, default) of each property in configuration order, as used
+    # by set(). Properties without a default have _MISSING.
+    set_order = tuple(
+        (prop_name, setters[prop_name], defaults.get(prop_name, _MISSING))
+        for prop_name in config
+    )
+    # Property names in LSB to MSB order.
+    iter_order = tuple(sorted(config, key=lambda n: config[n]["start"]))
+    # (name, getter, is bitdict) of each property in MSB to LSB order.
+    json_order = tuple(
+        (prop_name, getters[prop_name], config[prop_name]["type"] == "bitdict")
+        for prop_name in reversed(iter_order)
+    )
+    config_raw = _copy_config(config, subtype_lists)
+    valid_source, valid_values = _valid_source(fast, config_raw, selector_of)
+    # (name, getter, configuration, selector) of each property in configuration
+    # order, as used by inspect(). The selector is the (name, start,
+    # mask, configuration) of the selector of a 'bitdict' property, None otherwise.
+    check_order = []
+    for prop_name, prop_config in config_raw.items():
+        selector = selector_of.get(prop_name)
+        check_order.append(
+            (
+                prop_name,
+                getters[prop_name],
+                prop_config,
+                (
+                    None
+                    if selector is None
+                    else (
+                        selector,
+                        fast[selector][0],
+                        fast[selector][2],
+                        config_raw[selector],
+                    )
+                ),
+            )
+        )
 
     class BitDict:
         """
@@ -558,9 +1259,54 @@ def bitdict_factory(  # pylint: disable=too-many-statements
         ```
         """
 
-        _config: MappingProxyType[str, Any] = MappingProxyType(deepcopy(config))
+        # Instances only hold their value and position in a BitDict tree.
+        __slots__ = ("_value", "_subs", "_parent", "_parent_key", "_ancestors")
+
+        # Internal reads use the plain dict. get_config() returns the read-only view.
+        _config_raw: dict[str, Any] = config_raw
+        _config: MappingProxyType[str, Any] = MappingProxyType(_config_raw)
         subtypes: dict[str, list[type | None]] = subtype_lists
         _total_width: int = total_width
+        _max_uint: int = 1 << total_width
+        _min_int: int = -(1 << (total_width - 1)) if total_width else 0
+        _byte_len: int = (total_width + 7) // 8  # Round up to nearest byte
+        _fast: dict[str, tuple[int, int, int, int, int]] = fast
+        _selector_of: dict[str, str] = selector_of
+        _getters: dict[str, Callable[..., Any]] = getters
+        _setters: dict[str, Callable[..., Any]] = setters
+        _bitdict_props: tuple[tuple[str, int, int, int, int], ...] = bitdict_props
+        _sub_slots: dict[str, tuple[int, int]] = sub_slots
+        _sub_count: int = sub_count
+        _keys: frozenset[str] = frozenset(config)
+        _all_keys: frozenset[str] = all_keys
+        _sub_checks: tuple[tuple[int, int, int, int, tuple[Any, ...]], ...] = sub_checks
+        _set_int: Callable[..., None] = _compile_accessor(
+            _set_int_source(
+                total_width, bitdict_props, sub_slots, nested, bool(sub_checks)
+            ),
+            "_set_int",
+            {"_check_sub_values": _check_sub_values, "_sub_checks": sub_checks},
+        )
+        _set_order: tuple[tuple[str, Callable[..., Any], Any], ...] = set_order
+        _valid: Callable[..., bool] = _compile_accessor(
+            valid_source, "_valid", {"_values": valid_values, "_getters": getters}
+        )
+        _to_tuple: Callable[..., tuple[Any, ...]] = _compile_accessor(
+            _to_tuple_source(fast, iter_order), "_to_tuple", {"_getters": getters}
+        )
+        _defaults: dict[str, Any] = defaults
+        _default_value: int = default_value
+        _iter_order: tuple[str, ...] = iter_order
+        _json_order: tuple[tuple[str, Callable[..., Any], bool], ...] = json_order
+        _check_order: tuple[
+            tuple[
+                str,
+                Callable[..., Any],
+                dict[str, Any],
+                tuple[str, int, int, dict[str, Any]] | None,
+            ],
+            ...,
+        ] = tuple(check_order)
         title: str = _title
         __name__: str = name
 
@@ -597,7 +1343,9 @@ def bitdict_factory(  # pylint: disable=too-many-statements
             """
             self._value = 0
             # Instances of subbitdicts
-            self._subbitdicts: dict[str, list[BitDict | None]] = {}
+            # Allocated on first use: one flat list for all 'bitdict' properties
+            # indexed by the property base offset plus the selector value.
+            self._subs: list[BitDict | None] | None = None
 
             # Identification of this BitDict in a parent BitDict
             # These are set by _parent_config() when this BitDict is a sub-bitdict.
@@ -605,30 +1353,45 @@ def bitdict_factory(  # pylint: disable=too-many-statements
             # when this BitDict changes.
             self._parent: BitDict | None = None
             self._parent_key: str | None = None
+            # (ancestor, clear mask, field mask, shift) of this BitDict's bits in
+            # each ancestor value, nearest first.
+            self._ancestors: tuple[tuple[BitDict, int, int, int], ...] = ()
 
-            # Set to defaults
+            # Set to defaults: a new BitDict has no sub-bitdicts or parent to
+            # reset so the precomputed default value is all there is to it.
             if value is None:
-                self.reset()
+                self._value = self._default_value
             elif isinstance(value, int):
-                if value >= (1 << self._total_width):
-                    raise ValueError(
-                        f"Integer value {value} exceeds maximum"
-                        f" value for bit width {self._total_width}"
-                    )
-                if value < -(1 << (self._total_width - 1)):
+                if 0 <= value < self._max_uint:
+                    # Sub-bitdicts are created from the value when first used
+                    # but their fields are range checked now.
+                    if self._sub_checks:
+                        _check_sub_values(self._sub_checks, value)
+                    self._value = value
+                elif value < self._min_int:
                     raise ValueError(
                         f"Integer value {value} exceeds minimum"
                         f"value for bit width {self._total_width}"
                     )
-                self.set(value)
+                else:
+                    self._set_int(value)  # Raises the out of range error
+
             elif isinstance(value, (bytes, bytearray)):
-                if len(value) > (self._total_width + 7) // 8:  # +7 to round up
+                if len(value) > self._byte_len:
                     raise ValueError(
                         f"Bytes object too long for bit width {self._total_width}"
                     )
                 # Convert bytes to integer (big-endian)
-                self.set(int.from_bytes(value, "big"))
+                value = int.from_bytes(value, "big")
+                if value >= self._max_uint:
+                    self._set_int(value)  # Raises the out of range error
+                if self._sub_checks:
+                    _check_sub_values(self._sub_checks, value)
+                self._value = value
             elif isinstance(value, dict):
+                # Start from the defaults so that the value of every selected
+                # sub-bitdict matches its bits.
+                self._value = self._default_value
                 self.set(value)  # Use update to handle defaults and type checking
             else:
                 raise TypeError(
@@ -651,40 +1414,11 @@ def bitdict_factory(  # pylint: disable=too-many-statements
                 Can be a bool, int, or BitDict.
             Raises:
                 KeyError: If the key is not a valid property in the configuration.
-                ValueError: If attempting to read a 'reserved' property.
-                AssertionError: If the selector value for a 'bitdict' type is not an integer,
-                        or if an unknown property type is encountered.
             """
-            if key not in self._config:
+            getter = self._getters.get(key)
+            if getter is None:
                 raise KeyError(f"Invalid property: {key}")
-
-            prop_config = self._config[key]
-            start = prop_config["start"]
-            width = prop_config["width"]
-            mask = (1 << width) - 1
-            raw_value = (self._value >> start) & mask
-
-            if prop_config["type"] == "bool":
-                return bool(raw_value)
-
-            if prop_config["type"] == "uint":
-                return raw_value
-
-            if prop_config["type"] == "int":
-                # Two's complement conversion if the highest bit is set
-                return (
-                    raw_value - (1 << width)
-                    if raw_value & (1 << (width - 1))
-                    else raw_value
-                )
-
-            if prop_config["type"] == "bitdict":
-                selector_value: bool | int | BitDict = self[prop_config["selector"]]
-                assert isinstance(selector_value, int), "Selector must be an integer"
-                bd: BitDict = self._get_subbitdict(key, selector_value)
-                return bd
-
-            assert False, f"Unknown property type: {prop_config['type']}"
+            return getter(self)
 
         def __setitem__(self, key: str, value: bool | int) -> None:
             """Sets the value of a property within the BitDict.
@@ -699,72 +1433,18 @@ def bitdict_factory(  # pylint: disable=too-many-statements
                 TypeError: If the provided value is not of the expected type (boolean or integer)
                 for the property.
             """
-            if key not in self._config:
+            setter = self._setters.get(key)
+            if setter is None:
                 raise KeyError(f"Invalid property: {key}")
 
-            prop_config = self._config[key]
-            start = prop_config["start"]
-            width = prop_config["width"]
-            mask = (1 << width) - 1
-
-            match prop_config["type"]:
-                case "bool":
-                    if not isinstance(value, (bool, int)):
-                        raise TypeError(
-                            f"Expected boolean or integer value for property '{key}'"
-                        )
-                    value = 1 if value else 0
-                case "uint":
-                    if not isinstance(value, int):
-                        raise TypeError(f"Expected integer value for property '{key}'")
-                    if not 0 <= value < (1 << width):
-                        raise ValueError(
-                            f"Value {value} out of range for property '{key}'"
-                        )
-                case "int":
-                    if not isinstance(value, int):
-                        raise TypeError(f"Expected integer value for property '{key}'")
-                    if not -(1 << (width - 1)) <= value < (1 << (width - 1)):
-                        raise ValueError(
-                            f"Value {value} out of range for property '{key}'"
-                        )
-                    # Convert to two's complement representation
-                    if value < 0:
-                        value = (1 << width) + value
-                case "bitdict":
-                    # Set the sub-bitdict value.
-                    selector_value = self[prop_config["selector"]]
-                    assert isinstance(
-                        selector_value, int
-                    ), "Selector must be an integer"
-                    bd: BitDict = self._get_subbitdict(key, selector_value)
-                    bd.set(value)
-                    value = bd.to_int()
-                case _:
-                    assert False, f"Unknown property type: {prop_config['type']}"
-
             # If the property is a selector then the sub-bitdict
-            # changes and we need to update the value
+            # changes and the setter updates its value too.
             # Note that if the newly selected BitDict was previously
             # defined then that value will be used
             # or else it will be the default for the new BitDict.
             # It will not maintain the same numeric value.
             # This is important to call out in the user documentation.
-            if "_bitdict" in prop_config:
-                bd = self._get_subbitdict(prop_config["_bitdict"], value)
-                bdc = self._config[prop_config["_bitdict"]]
-                _mask = (1 << bdc["width"]) - 1
-                _start = bdc["start"]
-                self._value &= ~(_mask << _start)
-                self._value |= (bd.to_int() & _mask) << _start
-
-            # Clear the bits for this property, then set the new value
-            self._value &= ~(mask << start)
-            self._value |= (value & mask) << start
-
-            # If this BitDict is a sub-bitdict then update the parent
-            if self._parent is not None:
-                self._update_parent()
+            setter(self, value)
 
         def __len__(self) -> int:
             """
@@ -787,16 +1467,40 @@ def bitdict_factory(  # pylint: disable=too-many-statements
                 True if the property exists and is accessible given the current selector state,
                 False otherwise.
             """
-            retval: bool = key in self._config
-            if not retval:
-                for k, bd in self._config.items():
-                    if bd["type"] == "bitdict":
-                        bdi: bool | int | BitDict = self[k]
-                        assert not isinstance(bdi, int), "Expecting BitDict type."
-                        retval = retval or key in bdi
-                        if retval:
-                            break
-            return retval
+            if key in self._keys:
+                return True
+            if key not in self._all_keys:
+                return False
+            return self._contains_value(self._value, key)
+
+        @classmethod
+        def _contains_value(cls, value: int, key: str) -> bool:
+            """Check if a property is accessible in a BitDict with the given value.
+            Selector values are extracted from the integer so that no sub-BitDict
+            instances are created to answer the query.
+            Args:
+                value: The integer value of a BitDict of this class.
+                key: The property name (key) to check for.
+            Returns:
+                True if the property exists and is accessible given the selector
+                state encoded in `value`, False otherwise.
+            """
+            # pylint: disable=protected-access
+            if key in cls._keys:
+                return True
+            for prop_name, start, mask, sel_start, sel_mask in cls._bitdict_props:
+                subtype_list = cls.subtypes[prop_name]
+                selector_value = (value >> sel_start) & sel_mask
+                if selector_value >= len(subtype_list):
+                    continue
+                subtype: Any = subtype_list[selector_value]
+                if (
+                    subtype is not None
+                    and key in subtype._all_keys
+                    and subtype._contains_value((value >> start) & mask, key)
+                ):
+                    return True
+            return False
 
         def __iter__(self) -> Generator[tuple[str, bool | BitDict | int], Any, None]:
             """Iterates over the BitDict, yielding (name, value) pairs for each
@@ -807,9 +1511,9 @@ def bitdict_factory(  # pylint: disable=too-many-statements
                 field name and value is the corresponding value in the BitDict.
                 The values can be of type bool, Any, BitDict, or None.
             """
-            sps = sorted(self._config.items(), key=lambda item: item[1]["start"])
-            for name, _ in sps:
-                yield name, self[name]
+            getters = self._getters
+            for name in self._iter_order:
+                yield name, getters[name](self)
 
         def __repr__(self) -> str:
             """
@@ -850,60 +1554,93 @@ def bitdict_factory(  # pylint: disable=too-many-statements
                 The sub-BitDict associated with the given key and selector value.
                 The returned BitDict is guaranteed to exist.
             Raises:
+                IndexError: If no subtype is defined for the selector value.
                 AssertionError: If the subtype class has not been created for the
-                        given selector value, or if the created sub-BitDict
-                        is None.
+                        given selector value.
             """
 
-            prop_config = self._config[key]
-            if key not in self._subbitdicts:
-                width = self._config[prop_config["selector"]]["width"]
-                self._subbitdicts[key] = [None] * 2**width
-            sdk: list[BitDict | None] = self._subbitdicts[key]
-            if sdk[selector_value] is None:
-                if selector_value >= len(self.subtypes[key]):
-                    raise IndexError(
-                        "Subtype class not created for selector"
-                        f" {prop_config['selector']} at index {selector_value}"
-                    )
+            subs = self._subs
+            if subs is None:
+                subs = self._subs = [None] * self._sub_count
+            base, count = self._sub_slots[key]
+            if selector_value >= count:
+                raise IndexError(
+                    "Subtype class not created for selector"
+                    f" {self._selector_of[key]} at index {selector_value}"
+                )
+            retval: BitDict | None = subs[base + selector_value]
+            if retval is None:
                 bdtype: type[BitDict] | None = self.subtypes[key][selector_value]
                 assert bdtype is not None, "Subtype class not created!"
-                nbd = bdtype()
-                nbd._set_parent(self, key)  # pylint: disable=protected-access
-                sdk[selector_value] = nbd
-            retval: BitDict | None = sdk[selector_value]
-            assert retval is not None, "Subtype class not created!"
+                # The currently selected sub-BitDict takes its value from this
+                # BitDict. Any other starts at its defaults.
+                start, _, mask, _, _ = self._fast[key]
+                sel_start, _, sel_mask, _, _ = self._fast[self._selector_of[key]]
+                if selector_value == (self._value >> sel_start) & sel_mask:
+                    retval = bdtype((self._value >> start) & mask)
+                else:
+                    retval = bdtype()
+                retval._set_parent(self, key)  # pylint: disable=protected-access
+                subs[base + selector_value] = retval
             return retval
 
+        def _hold_selected(self, key: str) -> None:
+            """Creates the selected sub-BitDict of a property if it does not exist.
+            Sub-BitDicts are created from this BitDict's value when first used.
+            This is called before the selector changes so that the value of the
+            previously selected sub-BitDict is kept rather than lost.
+            Args:
+                key: The name of a 'bitdict' property.
+            """
+
+            base, count = self._sub_slots[key]
+            sel_start, _, sel_mask, _, _ = self._fast[self._selector_of[key]]
+            selector_value = (self._value >> sel_start) & sel_mask
+            if selector_value >= count or self.subtypes[key][selector_value] is None:
+                return
+            subs = self._subs
+            if subs is None or subs[base + selector_value] is None:
+                self._get_subbitdict(key, selector_value)
+
         def _set_parent(self, parent: BitDict, key: str) -> None:
             """Sets the parent BitDict and the key associated with this BitDict in the parent.
+            The position of this BitDict's bits in the value of every ancestor is
+            composed here, once, so that updates do not walk the configuration.
             Args:
                 parent: The parent BitDict.
                 key: The key associated with this BitDict in the parent.
             """
 
+            # pylint: disable=protected-access
             self._parent = parent
             self._parent_key = key
+            start, _, mask, _, _ = parent._fast[key]
+            field_mask = mask << start
+            ancestors = [(parent, ~field_mask, field_mask, start)]
+            for ancestor, _, anc_mask, anc_shift in parent._ancestors:
+                nested_mask = (field_mask << anc_shift) & anc_mask
+                ancestors.append(
+                    (ancestor, ~nested_mask, nested_mask, start + anc_shift)
+                )
+            self._ancestors = tuple(ancestors)
+            # Sub-bitdicts created before this BitDict was attached (e.g. by
+            # reset()) must extend their chains with the new ancestors.
+            if self._subs is not None:
+                for sub in self._subs:
+                    if sub is not None:
+                        sub._set_parent(self, sub._parent_key)
 
         def _update_parent(self) -> None:
-            """Updates the parent BitField with the current value of this BitField.
-            This method assumes that the parent BitField, as well as the key
-            associated with this BitField within the parent's configuration,
-            are properly set. It calculates a mask based on the width defined
-            in the parent's configuration for this BitField, clears the
-            corresponding bits in the parent's value, and then sets those bits
-            to the current value of this BitField.
+            """Updates the ancestor BitDicts with the current value of this BitDict.
+            Each ancestor has the bits this BitDict occupies cleared and then
+            replaced with the current value of this BitDict, using the offsets
+            composed by _set_parent().
             """
 
-            assert self._parent is not None, "Parent not set"
-            assert self._parent_key is not None, "Parent key not set"
-            pc = self._parent._config[  # pylint: disable=protected-access
-                self._parent_key
-            ]
-            mask = (1 << pc["width"]) - 1
-            start = pc["start"]
-            self._parent._value &= ~(mask << start)
-            self._parent._value |= (self.to_int() & mask) << start
+            # pylint: disable=protected-access
+            value = self._value
+            for ancestor, clear, mask, shift in self._ancestors:
+                ancestor._value = (ancestor._value & clear) | ((value << shift) & mask)
 
         def clear(self) -> None:
             """Clears the bit dictionary, setting all bits to 0."""
@@ -912,21 +1649,40 @@ def bitdict_factory(  # pylint: disable=too-many-statements
 
         def reset(self) -> None:
             """Resets the BitDict to its default values.
-            Iterates through the properties defined in the configuration.
-            If a property is a reserved type, it is skipped.
-            If a property is a nested BitDict, its reset method is called recursively.
-            Otherwise, the property is set to its default value as specified in the configuration.
+            The integer value is replaced with the default value precomputed when
+            the class was created. Nested BitDicts selected by the default
+            selector values that have already been created are reset recursively.
             """
 
-            for prop_name, prop_config in self._config.items():
-                if prop_config["type"] == "bitdict":
-                    selector_value = self[prop_config["selector"]]
-                    assert isinstance(
-                        selector_value, int
-                    ), "Selector must be an integer"
-                    self._get_subbitdict(prop_name, selector_value).reset()
-                else:
-                    self[prop_name] = prop_config["default"]
+            default_value = self._default_value
+            for prop_name, _, _, sel_start, sel_mask in self._bitdict_props:
+                if (self._value ^ default_value) & (sel_mask << sel_start):
+                    self._hold_selected(prop_name)
+            self._value = default_value
+            if self._subs is not None:
+                self._reset_subs()
+            if self._ancestors:
+                self._update_parent()
+
+        def _reset_subs(self) -> None:
+            """Resets the materialized sub-BitDicts selected by the default value.
+            The value of this BitDict already holds their default bits so they
+            are reset in place without updating their parents.
+            """
+
+            # pylint: disable=protected-access
+            subs = self._subs
+            assert subs is not None, "Sub-BitDicts not allocated"
+            value = self._value
+            for prop_name, _, _, sel_start, sel_mask in self._bitdict_props:
+                base, count = self._sub_slots[prop_name]
+                selector_value = (value >> sel_start) & sel_mask
+                if selector_value < count:
+                    sub = subs[base + selector_value]
+                    if sub is not None:
+                        sub._value = sub._default_value
+                        if sub._subs is not None:
+                            sub._reset_subs()
 
         def set(self, value: int | dict[str, Any]) -> None:
             """Sets the value of the BitDict.
@@ -948,37 +1704,21 @@ def bitdict_factory(  # pylint: disable=too-many-statements
             Raises:
                 ValueError: If the integer value is outside the allowed range for
                 the configured bit width.
-                AssertionError: If the selector value is not an integer when setting
-                a sub-BitDict.
             """
 
             if isinstance(value, dict):
-                for prop_name, prop_config in self._config.items():
-                    if prop_name in value:
-                        self[prop_name] = value[prop_name]
-                    elif "default" in prop_config:
-                        self[prop_name] = prop_config["default"]
+                if value.keys() >= self._keys:
+                    # Complete input: no defaults to fall back on.
+                    for prop_name, setter, _ in self._set_order:
+                        setter(self, value[prop_name])
+                    return
+                # One lookup per property falls back to its default, if any.
+                for prop_name, setter, default in self._set_order:
+                    prop_value = value.get(prop_name, default)
+                    if prop_value is not _MISSING:
+                        setter(self, prop_value)
             else:
-                if value >= (1 << self._total_width):
-                    raise ValueError(
-                        f"Integer value {value} exceeds maximum"
-                        f" value for bit width {self._total_width}"
-                    )
-                if value < 0:
-                    raise ValueError(f"Integer must be non-negative, got {value}")
-                self._value: int = value
-
-                # Must set sub-bitdicts after setting the main value.
-                for prop_name, prop_config in self._config.items():
-                    if prop_config["type"] == "bitdict":
-                        selector_value = self[prop_config["selector"]]
-                        assert isinstance(
-                            selector_value, int
-                        ), "Selector must be an integer"
-                        bd_value = (value >> prop_config["start"]) & (
-                            (1 << prop_config["width"]) - 1
-                        )
-                        self._get_subbitdict(prop_name, selector_value).set(bd_value)
+                self._set_int(value)
 
         def update(self, data: dict[str, Any]) -> None:
             """Update the BitDict with values from another dictionary.
@@ -994,13 +1734,18 @@ def bitdict_factory(  # pylint: disable=too-many-statements
 
             if not isinstance(data, dict):
                 raise TypeError("update() requires a dictionary")
+            # The generated setters do the type/range checking of __setitem__.
+            setters = self._setters
             for key, value in data.items():
-                self[key] = value  # Use __setitem__ for type/range checking
+                setter = setters.get(key)
+                if setter is None:
+                    raise KeyError(f"Invalid property: {key}")
+                setter(self, value)
 
         def to_json(self) -> dict[str, Any]:
             """
             Converts the BitDict to a JSON-serializable dictionary.
-            Iterates through the BitDict in reverse order, creating a dictionary
+            Iterates through the properties in MSB to LSB order, creating a dictionary
             where keys are the names of the bitfields and values are their
             corresponding values. If a value is a BitDict itself, its `to_json`
             method is called recursively to convert it to a JSON-serializable
@@ -1010,14 +1755,22 @@ def bitdict_factory(  # pylint: disable=too-many-statements
                 for JSON serialization.
             """
 
-            result = {}
-            for name, _ in list(self)[::-1]:  # Use the iterator
-                result[name] = self[name]
-                if hasattr(result[name], "to_json"):
-                    result[name] = result[
-                        name
-                    ].to_json()  # Recurse for nested bitdicts.
-            return result
+            # Recurse for nested bitdicts.
+            return {
+                name: getter(self).to_json() if is_bitdict else getter(self)
+                for name, getter, is_bitdict in self._json_order
+            }
+
+        def to_tuple(self) -> tuple[bool | int | BitDict, ...]:
+            """Returns the values of all properties in LSB to MSB order.
+            The values are those `__iter__` yields, decoded together without
+            per-property dispatch. 'bitdict' properties are returned as the
+            selected sub-BitDict.
+            Returns:
+                tuple[bool | int | BitDict, ...]: The property values.
+            """
+
+            return self._to_tuple()
 
         def to_bytes(self) -> bytes:
             """Convert the bit dictionary to a byte string.
@@ -1029,8 +1782,7 @@ def bitdict_factory(  # pylint: disable=too-many-statements
                 bytes: A byte string representing the bit dictionary's value.
             """
 
-            num_bytes = (self._total_width + 7) // 8  # Round up to nearest byte
-            return self._value.to_bytes(num_bytes, "big")
+            return self._value.to_bytes(self._byte_len, "big")
 
         def to_int(self) -> int:
             """
@@ -1045,54 +1797,29 @@ def bitdict_factory(  # pylint: disable=too-many-statements
 
         def valid(self) -> bool:
             """Checks if all properties have valid values."""
-            for prop_name, prop_config in self._config.items():
-                if prop_config["type"] == "bitdict":
-                    selector_value = self[prop_config["selector"]]
-                    assert isinstance(
-                        selector_value, int
-                    ), "Selector must be an integer"
-                    if not _is_valid_value(
-                        selector_value, self._config[prop_config["selector"]]
-                    ):
-                        return False
-                    sub_bitdict = self._get_subbitdict(prop_name, selector_value)
-                    if not sub_bitdict.valid():
-                        return False
-                else:
-
-                    value = self[prop_name]
-                    assert isinstance(
-                        value, (int, bool)
-                    ), "Value must be an integer or boolean"
-                    if not _is_valid_value(value, prop_config):
-                        return False
-            return True
+            return self._valid()
 
         def inspect(self) -> dict[str, dict[str, bool | int | dict]]:
             """Inspects the BitDict and returns a dictionary of properties with invalid values."""
             invalid_props = {}
-            for prop_name, prop_config in self._config.items():
-                if prop_config["type"] == "bitdict":
-                    selector_value = self[prop_config["selector"]]
-                    assert isinstance(
-                        selector_value, int
-                    ), "Selector must be an integer"
-                    if not _is_valid_value(
-                        selector_value, self._config[prop_config["selector"]]
-                    ):
-                        invalid_props[prop_config["selector"]] = selector_value
+            for prop_name, getter, prop_config, selector in self._check_order:
+                if selector is not None:
+                    # The selector is read straight from the integer value.
+                    selector_name, sel_start, sel_mask, selector_config = selector
+                    selector_value = (self._value >> sel_start) & sel_mask
+                    if not _is_valid_value(selector_value, selector_config):
+                        invalid_props[selector_name] = self[selector_name]
                     else:
-                        sub_bitdict = self._get_subbitdict(prop_name, selector_value)
-                        sub_invalid_props = sub_bitdict.inspect()
+                        sub_invalid_props = getter(self).inspect()
                         if sub_invalid_props:
                             invalid_props[prop_name] = sub_invalid_props
                 else:
-                    value = self[prop_name]
+                    value = getter(self)
                     assert isinstance(
                         value, (int, bool)
                     ), "Value must be an integer or boolean"
                     if not _is_valid_value(value, prop_config):
-                        invalid_props[prop_name] = self[prop_name]
+                        invalid_props[prop_name] = value
             return invalid_props
 
         @classmethod
@@ -1109,8 +1836,164 @@ def bitdict_factory(  # pylint: disable=too-many-statements
 
             return cls._config
 
+        @classmethod
+        def ints_from_bytes_array(
+            cls,
+            buf: bytes | bytearray | memoryview,
+            count: int | None = None,
+            stride: int | None = None,
+        ) -> list[int]:
+            """Decodes a buffer of packed big-endian records into integer values.
+            Each record starts with the `to_bytes()` representation of one BitDict
+            i.e. the total width rounded up to whole bytes. No BitDict instances
+            are created.
+            Args:
+                buf: The buffer of packed records.
+                count: The number of records to decode. Defaults to as many
+                    whole records as the buffer holds, none for zero width.
+                stride: The number of bytes from the start of one record to the
+                    start of the next. Defaults to the `to_bytes()` length.
+            Returns:
+                list[int]: The decoded integer values in buffer order.
+            Raises:
+                ValueError: If `count` is negative, the stride is not positive or
+                    shorter than a record, the buffer is shorter than `count`
+                    records or a record exceeds the maximum value for the width.
+            """
+
+            num_bytes = cls._byte_len
+            if stride is None:
+                stride = num_bytes
+            elif stride < num_bytes or stride <= 0:
+                raise ValueError(f"Bad stride {stride} for {num_bytes} byte records")
+            if count is not None and count < 0:
+                raise ValueError(f"Record count {count} must not be negative")
+            if not stride:  # Zero width records take no bytes and are all 0.
+                return [0] * (count or 0)
+            view = memoryview(buf).cast("B")
+            if count is None:
+                # The last record need not be padded out to a full stride.
+                count = max(len(view) - num_bytes + stride, 0) // stride
+            if count > 0 and (count - 1) * stride + num_bytes > len(view):
+                raise ValueError(
+                    f"Buffer of {len(view)} bytes too short for {count} records"
+                    f" of {num_bytes} bytes"
+                )
+            from_bytes = int.from_bytes
+            values = [
+                from_bytes(view[i : i + num_bytes], "big")
+                for i in range(0, count * stride, stride)
+            ]
+            # Whole byte records cannot exceed the range, the rest can.
+            if cls._total_width & 7 and values:
+                value = max(values)
+                if value >= cls._max_uint:
+                    raise ValueError(
+                        f"Integer value {value} exceeds maximum value"
+                        f" for bit width {cls._total_width}"
+                    )
+            return values
+
+        @classmethod
+        def extract_field(cls, values: Iterable[int], key: str) -> list[bool | int]:
+            """Extracts one property from many integer BitDict values.
+            This decodes the property directly from each integer, e.g. those
+            returned by `ints_from_bytes_array()`, without creating BitDicts.
+            Args:
+                values: Integer values of BitDicts of this class.
+                key: The name of a 'bool', 'uint' or 'int' property.
+            Returns:
+                list[bool | int]: The property value decoded from each integer.
+            Raises:
+                KeyError: If the property does not exist.
+                ValueError: If the property is a 'bitdict' property.
+            """
+
+            field = cls._fast.get(key)
+            if field is None:
+                raise KeyError(f"Invalid property: {key}")
+            start, _, mask, sign_bit, type_code = field
+            if type_code == _BOOL:
+                bit = 1 << start
+                return [value & bit != 0 for value in values]
+            if type_code == _UINT:
+                return [(value >> start) & mask for value in values]
+            if type_code == _INT:
+                return [
+                    (((value >> start) & mask) ^ sign_bit) - sign_bit
+                    for value in values
+                ]
+            raise ValueError(f"Cannot extract 'bitdict' property: {key}")
+
+        @classmethod
+        def from_bytes_array(
+            cls,
+            buf: bytes | bytearray | memoryview,
+            count: int | None = None,
+            stride: int | None = None,
+        ) -> list[BitDict]:
+            """Creates BitDicts from a buffer of packed big-endian records.
+            See `ints_from_bytes_array()` for the buffer layout.
+            Args:
+                buf: The buffer of packed records.
+                count: The number of records to decode. Defaults to as many
+                    whole records as the buffer holds, none for zero width.
+                stride: The number of bytes from the start of one record to the
+                    start of the next. Defaults to the `to_bytes()` length.
+            Returns:
+                list[BitDict]: The decoded BitDicts in buffer order.
+            Raises:
+                ValueError: If `count` is negative, the stride is not positive or
+                    shorter than a record, the buffer is shorter than `count`
+                    records or a record exceeds the maximum value for the width.
+            """
+
+            return [
+                cls(value) for value in cls.ints_from_bytes_array(buf, count, stride)
+            ]
+
+        @classmethod
+        def to_bytes_array(cls, bitdicts: Iterable[BitDict]) -> bytes:
+            """Packs BitDicts into a single buffer of big-endian records.
+            This is the inverse of `from_bytes_array()`.
+            Args:
+                bitdicts: The BitDicts to pack. Each must be an instance of this class.
+            Returns:
+                bytes: The concatenated `to_bytes()` representation of each BitDict.
+            Raises:
+                TypeError: If a BitDict is not an instance of this class.
+            """
+
+            values = []
+            for bd in bitdicts:
+                if not isinstance(bd, cls):
+                    raise TypeError(f"Expected {cls.__name__} instance, got {type(bd)}")
+                values.append(bd._value)  # pylint: disable=protected-access
+            num_bytes = cls._byte_len
+            struct_code = _STRUCT_CODES.get(num_bytes)
+            if struct_code is not None:
+                # Records of a native integer size are packed in one C call.
+                return pack(f">{len(values)}{struct_code}", *values)
+            return b"".join([value.to_bytes(num_bytes, "big") for value in values])
+
     # end class BitDict
 
     # Set the name of the dynamically created class.
     BitDict.__name__ = name
-    return BitDict
+
+    # Properties are also accessible as attributes unless the name is taken by
+    # the class itself, e.g. a property called 'title' or 'reset'.
+    for prop_name, prop_config in config.items():
+        if not hasattr(BitDict, prop_name):
+            setattr(
+                BitDict,
+                prop_name,
+                property(
+                    getters[prop_name],
+                    setters[prop_name],
+                    doc=prop_config.get("description") or None,
+                ),
+            )
+    # Validation normalised the caller's configuration in place so the class is
+    # also cached under that form, as passed again by e.g. a reused subtype.
+    return _cache_class(BitDict, cache_key, _factory_cache_key(config, name, title))
@@ -31,109 +31,134 @@ A list of formatted markdown strings representing the bitdict configuration in t
 """
 
 
-def _format_undefined_row(current_bit: int, start: int, include_types: bool) -> str:
+from typing import Callable
+
+# Row templates taking (name, type, bitfield, default, description). The choice
+# of template is made once per table rather than once per row.
+_TYPED_ROW = "| {0} | {1} | {2} | {3} | {4} |"
+_UNTYPED_ROW = "| {0} | {2} | {3} | {4} |"
+
+
+def _format_undefined_row(
+    current_bit: int, start: int, format_row: Callable[..., str]
+) -> str:
     """Formats a row for undefined bits in the table."""
-    undefined_name = "Undefined"
     undefined_bitfield = (
         f"{current_bit}-{start - 1}" if start - current_bit > 1 else f"{current_bit}"
     )
-    if include_types:
-        return f"| {undefined_name} | N/A | {undefined_bitfield} | N/A | N/A |"
-    return f"| {undefined_name} | {undefined_bitfield} | N/A | N/A |"
+    return format_row("Undefined", "N/A", undefined_bitfield, "N/A", "N/A")
 
 
 def _get_description(prop_config: dict) -> str:
     """Extracts and formats the description from the property configuration."""
-    description = ""
-    if "valid" in prop_config:
-        valid_values = prop_config["valid"].get("value")
-        valid_range = prop_config["valid"].get("range")
-        if valid_values:
-            description += f"Valid values: {valid_values}. "
-        if valid_range:
-            description += f"Valid ranges: {valid_range}. "
-    return description + prop_config.get("description", "")
-
-
-def _format_row(name: str, prop_config: dict, **kwargs) -> str:
-    """Formats a standard data row for the table."""
-    bitfield = kwargs.get("bitfield", "N/A")
-    default = kwargs.get("default", "N/A")
-    description = kwargs.get("description", "")
-    include_types = kwargs.get("include_types", True)
-
-    if include_types:
-        return f"| {name} | {prop_config['type']} | {bitfield} | {default} | {description} |"
-    return f"| {name} | {bitfield} | {default} | {description} |"
+    description = prop_config.get("description", "")
+    valid_config = prop_config.get("valid")
+    if not valid_config:  # Most properties have no 'valid' key
+        return description
+    valid_values = valid_config.get("value")
+    valid_range = valid_config.get("range")
+    if valid_range:
+        description = f"Valid ranges: {valid_range}. {description}"
+    if valid_values:
+        description = f"Valid values: {valid_values}. {description}"
+    return description
 
 
 def _process_property(
-    name: str, prop_config: dict, current_bit: int, include_types: bool
+    name: str,
+    start: int,
+    prop_config: dict,
+    current_bit: int,
+    format_row: Callable[..., str],
 ) -> tuple[list[str], int]:
     """Processes a single property and returns the row and the updated current bit."""
     rows = []
-    start = prop_config["start"]
     width = prop_config["width"]
+    prop_type = prop_config["type"]
     end = start + width - 1
 
     if start > current_bit:
-        undefined_row = _format_undefined_row(current_bit, start, include_types)
+        undefined_row = _format_undefined_row(current_bit, start, format_row)
         rows.append(undefined_row)
 
     bitfield = f"{end}:{start}" if width > 1 else f"{start}"
-    default = prop_config.get("default", "N/A")
-    description = _get_description(prop_config)
-
-    if prop_config["type"] == "bitdict":
+    if prop_type == "bitdict":
         default = "N/A"
         description = f"See '{name}' definition table(s)."
+    else:
+        default = prop_config.get("default", "N/A")
+        description = _get_description(prop_config)
 
-    row = _format_row(
-        name,
-        prop_config,
-        bitfield=bitfield,
-        default=default,
-        description=description,
-        include_types=include_types,
-    )
+    row = format_row(name, prop_type, bitfield, default, description)
     rows.append(row)
     current_bit = end + 1
     return rows, current_bit
 
 
-def _generate_table_header(include_types: bool, title: str) -> str:
-    """Generates the table header based on whether types should be included."""
-    header = f"## {title}\n\n"
-    header += (
-        "| Name | Type | Bitfield | Default | Description |\n"
-        if include_types
-        else "| Name | Bitfield | Default | Description |\n"
-    )
-    header += "|---|:-:|:-:|:-:|---|\n" if include_types else "|---|:-:|:-:|---|\n"
-    return header
+def _generate_table_header(include_types: bool, title: str) -> list[str]:
+    """Generates the table header lines based on whether types should be included."""
+    if include_types:
+        return [
+            f"## {title}",
+            "",
+            "| Name | Type | Bitfield | Default | Description |",
+            "|---|:-:|:-:|:-:|---|",
+        ]
+    return [
+        f"## {title}",
+        "",
+        "| Name | Bitfield | Default | Description |",
+        "|---|:-:|:-:|---|",
+    ]
 
 
 def _generate_table_rows(config: dict, include_types: bool) -> list[str]:
     """Generates the table rows from the configuration dictionary."""
     rows = []
     current_bit = 0
-    sorted_properties = sorted(config.items(), key=lambda item: item[1]["start"])
+    format_row = (_TYPED_ROW if include_types else _UNTYPED_ROW).format
+    # Property names are unique so tuple comparison never reaches the config.
+    sorted_properties = sorted(
+        (prop_config["start"], name, prop_config) for name, prop_config in config.items()
+    )
 
-    for name, prop_config in sorted_properties:
+    for start, name, prop_config in sorted_properties:
         new_rows, current_bit = _process_property(
-            name, prop_config, current_bit, include_types
+            name, start, prop_config, current_bit, format_row
         )
         rows.extend(new_rows)
 
     return rows
 
 
-def _process_subtypes(subtypes: dict, include_types: bool) -> list[str]:
-    """Processes nested bitdicts and generates their markdown tables."""
+def _process_subtypes(bitdict_t: type, include_types: bool) -> list[str]:
+    """Processes nested bitdicts and generates their markdown tables.
+    Subtype classes are shared between identical selector slots so each table
+    is titled with the property, selector and selector value of its slot."""
+    _config = bitdict_t.get_config()
     markdown_tables = []
-    for subtypes_list in subtypes.values():
-        for subtype in subtypes_list:
-            markdown_tables.extend(generate_markdown_tables(subtype, include_types))
+    for prop_name, subtypes_list in bitdict_t.subtypes.items():
+        selector = _config[prop_name]["selector"]
+        for idx, subtype in enumerate(subtypes_list):
+            markdown_tables.extend(
+                _generate_tables(
+                    subtype, include_types, f"{prop_name}: {selector} = {idx}"
+                )
+            )
+    return markdown_tables
+
+
+def _generate_tables(bitdict_t: type, include_types: bool, title: str) -> list[str]:
+    """Generates the markdown table of a bitdict class, with the given title,
+    followed by the tables of its subtypes."""
+    # The header and rows are joined into the table in a single pass.
+    table_lines = _generate_table_header(include_types, title)
+    table_lines.extend(_generate_table_rows(bitdict_t.get_config(), include_types))
+    table = "\n".join(table_lines)
+
+    markdown_tables = [table]
+    markdown_tables.extend(_process_subtypes(bitdict_t, include_types))
+
     return markdown_tables
 
 
@@ -148,12 +173,4 @@ def generate_markdown_tables(bitdict_t: type, include_types: bool = True) -> lis
     Returns:
         A list of formatted markdown strings representing the bitdict configuration in table format.
     """
-    _config = bitdict_t.get_config()
-    table_header = _generate_table_header(include_types, bitdict_t.title)
-    table_rows = _generate_table_rows(_config, include_types)
-    table = table_header + "\n".join(table_rows)
-
-    markdown_tables = [table]
-    markdown_tables.extend(_process_subtypes(bitdict_t.subtypes, include_types))
-
-    return markdown_tables
+    return _generate_tables(bitdict_t, include_types, bitdict_t.title)
@@ -11,6 +11,11 @@ import unittest
 from types import MappingProxyType
 
 from bitdict import bitdict_factory
+from bitdict.bitdict import _getter_source, _setter_source
+
+# A valid 4-bit uint field. Negative tests overlay the one key they break
+# rather than spelling out the whole field definition.
+_BASE_FIELD = {"start": 0, "width": 4, "type": "uint"}
 
 
 class TestBitDictFactory(unittest.TestCase):
@@ -74,12 +79,10 @@ class TestBitDictFactory(unittest.TestCase):
         keys are missing from the field definitions.
         Specifically, it checks for missing 'width', 'start', and 'type' keys.
         """
-        with self.assertRaises(ValueError):
-            bitdict_factory({"field1": {"start": 0, "type": "uint"}})  # Missing width
-        with self.assertRaises(ValueError):
-            bitdict_factory({"field1": {"width": 4, "type": "uint"}})  # Missing start
-        with self.assertRaises(ValueError):
-            bitdict_factory({"field1": {"start": 0, "width": 4}})  # Missing type
+        for missing in ("width", "start", "type"):
+            field = {k: v for k, v in _BASE_FIELD.items() if k != missing}
+            with self.subTest(missing=missing), self.assertRaises(ValueError):
+                bitdict_factory({"field1": field})
 
     def test_factory_invalid_start_value(self):
         """
@@ -89,10 +92,9 @@ class TestBitDictFactory(unittest.TestCase):
         - A negative integer (-1).
         - A string ("0").
         """
-        with self.assertRaises(ValueError):
-            bitdict_factory({"field1": {"start": -1, "width": 4, "type": "uint"}})
-        with self.assertRaises(ValueError):
-            bitdict_factory({"field1": {"start": "0", "width": 4, "type": "uint"}})
+        for start in (-1, "0"):
+            with self.subTest(start=start), self.assertRaises(ValueError):
+                bitdict_factory({"field1": {**_BASE_FIELD, "start": start}})
 
     def test_factory_invalid_width_value(self):
         """Tests that the bitdict_factory raises a ValueError when an invalid
@@ -103,12 +105,9 @@ class TestBitDictFactory(unittest.TestCase):
             - Negative values (e.g., -1)
             - Non-integer values (e.g., "4")
         """
-        with self.assertRaises(ValueError):
-            bitdict_factory({"field1": {"start": 0, "width": 0, "type": "uint"}})
-        with self.assertRaises(ValueError):
-            bitdict_factory({"field1": {"start": 0, "width": -1, "type": "uint"}})
-        with self.assertRaises(ValueError):
-            bitdict_factory({"field1": {"start": 0, "width": "4", "type": "uint"}})
+        for width in (0, -1, "4"):
+            with self.subTest(width=width), self.assertRaises(ValueError):
+                bitdict_factory({"field1": {**_BASE_FIELD, "width": width}})
 
     def test_factory_invalid_type_value(self):
         """
@@ -116,7 +115,7 @@ class TestBitDictFactory(unittest.TestCase):
         specified in the field definition.
         """
         with self.assertRaises(ValueError):
-            bitdict_factory({"field1": {"start": 0, "width": 4, "type": "invalid"}})
+            bitdict_factory({"field1": {**_BASE_FIELD, "type": "invalid"}})
 
     def test_factory_bool_width_mismatch(self):
         """
@@ -132,9 +131,7 @@ class TestBitDictFactory(unittest.TestCase):
         field has a negative default value.
         """
         with self.assertRaises(ValueError):
-            bitdict_factory(
-                {"field1": {"start": 0, "width": 4, "type": "uint", "default": -3}}
-            )
+            bitdict_factory({"field1": {**_BASE_FIELD, "default": -3}})
 
     def test_factory_invalid_int_default(self):
         """
@@ -143,9 +140,7 @@ class TestBitDictFactory(unittest.TestCase):
         out of range for the specified width.
         """
         with self.assertRaises(ValueError):
-            bitdict_factory(
-                {"field1": {"start": 0, "width": 4, "type": "int", "default": 17}}
-            )
+            bitdict_factory({"field1": {**_BASE_FIELD, "type": "int", "default": 17}})
 
     def test_factory_invalid_bool_default(self):
         """
@@ -167,11 +162,11 @@ class TestBitDictFactory(unittest.TestCase):
         """
         with self.assertRaises(ValueError):
             bitdict_factory(
-                {"field1": {"start": 0, "width": 4, "type": "bitdict"}}
+                {"field1": {**_BASE_FIELD, "type": "bitdict"}}
             )  # No subtype
         with self.assertRaises(ValueError):
             bitdict_factory(
-                {"field1": {"start": 0, "width": 4, "type": "bitdict", "subtype": {}}}
+                {"field1": {**_BASE_FIELD, "type": "bitdict", "subtype": {}}}
             )  # Not a list
 
     def test_factory_bitdict_missing_selector(self):
@@ -183,7 +178,7 @@ class TestBitDictFactory(unittest.TestCase):
         """
         with self.assertRaises(ValueError):
             bitdict_factory(
-                {"field1": {"start": 0, "width": 4, "type": "bitdict", "subtype": []}}
+                {"field1": {**_BASE_FIELD, "type": "bitdict", "subtype": []}}
             )  # No selector
         with self.assertRaises(ValueError):
             bitdict_factory(
@@ -305,34 +300,9 @@ class TestBitDictFactory(unittest.TestCase):
 
     def test_factory_invalid_valid_key(self):
         """Test that bitdict_factory raises a ValueError for invalid 'valid' key configurations."""
-        config = {
-            "field1": {"start": 0, "width": 4, "type": "uint", "valid": {}},
-        }
-        with self.assertRaises(ValueError):
-            bitdict_factory(config)
-
-        config = {
-            "field1": {"start": 0, "width": 4, "type": "uint", "valid": {"value": []}},
-        }
-        with self.assertRaises(ValueError):
-            bitdict_factory(config)
-
-        config = {
-            "field1": {
-                "start": 0,
-                "width": 4,
-                "type": "uint",
-                "valid": {"value": set()},
-            },
-        }
-        with self.assertRaises(ValueError):
-            bitdict_factory(config)
-
-        config = {
-            "field1": {"start": 0, "width": 4, "type": "uint", "valid": {"range": []}},
-        }
-        with self.assertRaises(ValueError):
-            bitdict_factory(config)
+        for valid in ({}, {"value": []}, {"value": set()}, {"range": []}):
+            with self.subTest(valid=valid), self.assertRaises(ValueError):
+                bitdict_factory({"field1": {**_BASE_FIELD, "valid": valid}})
 
     def test_factory_valid_config_with_invalid_values(self):
         """Test that bitdict_factory raises a ValueError for invalid values in the 'valid' key."""
@@ -419,17 +389,37 @@ class TestBitDict(unittest.TestCase):
     - Testing edge cases and various configurations to ensure robustness.
     """
 
-    def setUp(self):
+    # Expected renderings of my_bitdict(0x8C), and of it with Mode set True.
+    _EXPECTED_JSON_MODE_FALSE = {
+        "Constant": True,
+        "Mode": False,
+        "Reserved": 0,
+        "SubValue": {"PropA": 0, "PropB": -1},
+    }
+    _EXPECTED_JSON_MODE_TRUE = {
+        "Constant": True,
+        "Mode": True,
+        "Reserved": 0,
+        "SubValue": {"PropC": 1, "PropD": True},
+    }
+    _EXPECTED_STR = (
+        "{'Constant': True, 'Mode': False, 'Reserved': 0, "
+        "'SubValue': {'PropB': -1, 'PropA': 0}}"
+    )
+
+    @classmethod
+    def setUpClass(cls):
         """Set up the test environment.
 
-        This method initializes the configuration dictionary and creates an instance
-        of the MyBitDict class using the bitdict_factory. The configuration defines
+        This method initializes the configuration dictionary and creates the
+        MyBitDict class using the bitdict_factory, once for all tests. The configuration defines
         the structure of the bitfield, including fields like 'Constant', 'Mode', 'Reserved'
         and 'SubValue'. 'SubValue' is a nested bitdict that depends on the value of the
         'Mode' field.  Each field specifies its starting bit, width, and data type.
-        Default values are also provided for some fields.
+        Default values are also provided for some fields. Tests only create instances
+        of the class and must not modify it or the configuration.
         """
-        self.config = {
+        cls.config = {
             "Constant": {"start": 7, "width": 1, "type": "bool"},
             "Mode": {"start": 6, "width": 1, "type": "bool"},
             "Reserved": {"start": 4, "width": 2, "type": "uint"},
@@ -455,7 +445,9 @@ class TestBitDict(unittest.TestCase):
                 ],
             },
         }
-        self.my_bitdict = bitdict_factory(self.config, name="MyBitDict")
+        cls.my_bitdict = bitdict_factory(cls.config, name="MyBitDict")
+        # Read-only view so a test cannot change the configuration under the others.
+        cls.config = MappingProxyType(cls.config)
 
     def test_create_instance_int(self):
         """Test that a BitDict instance can be created from an integer.
@@ -479,14 +471,14 @@ class TestBitDict(unittest.TestCase):
         (more than one byte). Finally, it tests that padding works as expected when
         the input byte has leading zero bits.
         """
-        bd = self.my_bitdict(bytes([0x8C]))
+        bd = self.my_bitdict(b"\x8c")
         self.assertEqual(bd.to_int(), 0x8C)
-        bd2 = self.my_bitdict(bytearray([0x8C]))  # Test bytearray too
+        bd2 = self.my_bitdict(bytearray(b"\x8c"))  # Test bytearray too
         self.assertEqual(bd2.to_int(), 0x8C)
         with self.assertRaises(ValueError):
-            self.my_bitdict(bytes([0x01, 0x02]))  # Too long
+            self.my_bitdict(b"\x01\x02")  # Too long
         # Test padding:
-        bd3 = self.my_bitdict(bytes([0xC]))
+        bd3 = self.my_bitdict(b"\x0c")
         self.assertEqual(bd3.to_int(), 0xC)
 
     def test_create_instance_dict(self):
@@ -502,10 +494,15 @@ class TestBitDict(unittest.TestCase):
             {"Constant": True, "Mode": False, "SubValue": {"PropA": 2, "PropB": -1}}
         )
         self.assertEqual(bd.to_int(), 0b10001110)  # Check against expected value.
-        self.assertEqual(bd["Constant"], True)
-        self.assertEqual(bd["Mode"], False)
-        self.assertEqual(bd["SubValue"]["PropA"], 2)
-        self.assertEqual(bd["SubValue"]["PropB"], -1)
+        self.assertEqual(
+            bd.to_json(),
+            {
+                "Constant": True,
+                "Mode": False,
+                "Reserved": 0,
+                "SubValue": {"PropA": 2, "PropB": -1},
+            },
+        )
 
         # Test with missing values (should use defaults)
         bd2 = self.my_bitdict({"Constant": True})
@@ -598,6 +595,65 @@ class TestBitDict(unittest.TestCase):
         self.assertEqual(bd["SubValue"]["PropC"], 3)
         self.assertEqual(bd["SubValue"]["PropD"], False)
 
+    def test_deeply_nested_bitdict(self):
+        """Test that writes to a grandchild BitDict reach every ancestor value."""
+        inner = {
+            "Sel": {"start": 0, "width": 1, "type": "bool"},
+            "Leaf": {
+                "start": 1,
+                "width": 3,
+                "type": "bitdict",
+                "selector": "Sel",
+                "subtype": [
+                    {"X": {"start": 0, "width": 3, "type": "uint"}},
+                    {"Y": {"start": 0, "width": 3, "type": "int"}},
+                ],
+            },
+        }
+        config = {
+            "Top": {"start": 0, "width": 1, "type": "bool"},
+            "Mid": {
+                "start": 2,
+                "width": 4,
+                "type": "bitdict",
+                "selector": "Top",
+                "subtype": [inner, {"Z": {"start": 0, "width": 4, "type": "uint"}}],
+            },
+        }
+        bd = bitdict_factory(config)()
+        bd["Mid"]["Leaf"]["X"] = 5
+        self.assertEqual(bd["Mid"].to_int(), 0b1010)
+        self.assertEqual(bd.to_int(), 0b1010 << 2)
+        bd["Mid"]["Sel"] = True
+        bd["Mid"]["Leaf"]["Y"] = -1
+        self.assertEqual(bd["Mid"].to_int(), 0b1111)
+        self.assertEqual(bd.to_int(), 0b1111 << 2)
+
+    def test_reset(self):
+        """Test that reset restores the default value, including nested BitDicts."""
+        bd = self.my_bitdict()
+        self.assertEqual(bd.to_int(), 0x0C)
+        bd["Constant"] = True
+        bd["Reserved"] = 3
+        bd["SubValue"]["PropA"] = 2
+        nested = bd["SubValue"]
+        bd.reset()
+        self.assertEqual(bd.to_int(), 0x0C)
+        self.assertEqual(nested.to_int(), 0x0C)
+        self.assertEqual(nested["PropA"], 0)
+        nested["PropB"] = 0
+        self.assertEqual(bd.to_int(), 0x00)
+        nested.reset()
+        self.assertEqual(bd.to_int(), 0x0C)
+
+    def test_slots(self):
+        """Test that BitDict instances do not carry a per-instance __dict__."""
+        bd = self.my_bitdict()
+        self.assertFalse(hasattr(bd, "__dict__"))
+        self.assertFalse(hasattr(bd["SubValue"], "__dict__"))
+        with self.assertRaises(AttributeError):
+            bd.unknown = 1  # pylint: disable=attribute-defined-outside-init
+
     def test_len(self):
         """Test the __len__ method of the BitDict class.
 
@@ -664,18 +720,12 @@ class TestBitDict(unittest.TestCase):
     def test_repr(self):
         """Test the string representation of the BitDict."""
         bd = self.my_bitdict(0x8C)
-        self.assertEqual(
-            repr(bd),
-            "MyBitDict({'Constant': True, 'Mode': False, 'Reserved': 0, 'SubValue': {'PropB': -1, 'PropA': 0}})",
-        )
+        self.assertEqual(repr(bd), f"MyBitDict({self._EXPECTED_STR})")
 
     def test_str(self):
         """Test the string representation of the BitDict."""
         bd = self.my_bitdict(0x8C)
-        self.assertEqual(
-            str(bd),
-            "{'Constant': True, 'Mode': False, 'Reserved': 0, 'SubValue': {'PropB': -1, 'PropA': 0}}",
-        )
+        self.assertEqual(str(bd), self._EXPECTED_STR)
 
     def test_update(self):
         """Test the update method of the BitDict class.
@@ -703,27 +753,15 @@ class TestBitDict(unittest.TestCase):
         and different configurations.
         """
         bd = self.my_bitdict(0x8C)
-        expected_json = {
-            "Constant": True,
-            "Mode": False,
-            "Reserved": 0,
-            "SubValue": {"PropA": 0, "PropB": -1},
-        }
-        self.assertEqual(bd.to_json(), expected_json)
+        self.assertEqual(bd.to_json(), self._EXPECTED_JSON_MODE_FALSE)
         # Test nested to_json
         bd["Mode"] = True
-        expected_json = {
-            "Constant": True,
-            "Mode": True,
-            "Reserved": 0,
-            "SubValue": {"PropC": 1, "PropD": True},
-        }
-        self.assertEqual(bd.to_json(), expected_json)
+        self.assertEqual(bd.to_json(), self._EXPECTED_JSON_MODE_TRUE)
 
     def test_to_bytes(self):
         """Test that the bitdict can be converted to bytes."""
         bd = self.my_bitdict(0x8C)
-        self.assertEqual(bd.to_bytes(), bytes([0x8C]))
+        self.assertEqual(bd.to_bytes(), b"\x8c")
 
     def test_to_int(self):
         """Test that the to_int() method returns the correct integer representation
@@ -878,6 +916,12 @@ class TestBitDict(unittest.TestCase):
         self.assertTrue("PropC" in bd)  # Now selected
         self.assertFalse("PropA" in bd)  # No longer selected
 
+        bd = self.my_bitdict(0x8C)
+        self.assertFalse("Missing" in bd)
+        self.assertFalse("PropD" in bd)
+        self.assertTrue("PropB" in bd)
+        self.assertIsNone(bd._subs)  # Containment creates no sub-BitDicts
+
     def test_iter_with_various_configs(self):
         """Test the iteration order of a BitDict with various configurations.
         This test defines two different BitDict configurations with varying
@@ -952,14 +996,14 @@ class TestBitDict(unittest.TestCase):
         }
         MyBitDict1 = bitdict_factory(config1)
         bd1 = MyBitDict1(0b11111)
-        self.assertEqual(bd1.to_bytes(), bytes([0b11111]))
+        self.assertEqual(bd1.to_bytes(), b"\x1f")
 
         config2 = {
             "field1": {"start": 0, "width": 32, "type": "int"},
         }
         MyBitDict2 = bitdict_factory(config2)
         bd2 = MyBitDict2(0xFFFFFFFF)
-        self.assertEqual(bd2.to_bytes(), bytes([0xFF, 0xFF, 0xFF, 0xFF]))
+        self.assertEqual(bd2.to_bytes(), b"\xff\xff\xff\xff")
 
     def test_factory_invalid_config_mappingproxy(self):
         """
@@ -1064,7 +1108,7 @@ class TestBitDict(unittest.TestCase):
         """
 
         config = {
-            "field1": {"start": 0, "width": 4, "type": "uint", "default": "invalid"},
+            "field1": {**_BASE_FIELD, "default": "invalid"},
             "field2": {"start": 4, "width": 1, "type": "bool"},
             "field3": {"start": 5, "width": 4, "type": "int"},
         }
@@ -1164,16 +1208,10 @@ class TestBitDict(unittest.TestCase):
         with self.assertRaises(KeyError):
             _ = bd["InvalidKey"]
 
-    def test_getitem_unknown_property_type(self):
-        """Test that __getitem__ raises an AssertionError for an unknown property type."""
-        config = {
-            "field1": {"start": 0, "width": 4, "type": "uint"},
-        }
-        MyBitDict = bitdict_factory(config)
-        bd = MyBitDict()
-        bd._config["field1"]["type"] = "unknown"  # pylint: disable=protected-access
+    def test_getter_source_rejects_unknown_type(self):
+        """Test that getter generation raises an AssertionError for an unknown property type."""
         with self.assertRaises(AssertionError):
-            _ = bd["field1"]
+            _getter_source("field1", (0, 4, 15, 8, -1), None)
 
     def test_clear(self):
         """Test the clear method of the BitDict class.
@@ -1521,13 +1559,10 @@ class TestBitDict(unittest.TestCase):
         bd["BitDict1"]["BitDict2"]["BitDict3"]["fieldF"] = 1
         self.assertEqual(bd["BitDict1"]["BitDict2"]["BitDict3"]["fieldF"], 1)
 
-    def test_setitem_reserved_field(self):
-        """Test that setting a reserved field raises an AssertionError."""
-
-        bd = self.my_bitdict()
-        bd._config["Reserved"]["type"] = "unknown"  # pylint: disable=protected-access
+    def test_setter_source_rejects_unknown_type(self):
+        """Test that setter generation raises an AssertionError for an unknown property type."""
         with self.assertRaises(AssertionError):
-            bd["Reserved"] = 1
+            _setter_source("Reserved", (4, 2, 3, 2, -1), None, None)
 
     def test_setitem_int_overflow(self):
         """Test that setting an item with an integer that overflows the
@@ -1563,7 +1598,7 @@ class TestBitDict(unittest.TestCase):
     def test_factory_invalid_valid_key_not_dict(self):
         """Test that bitdict_factory raises a ValueError when 'valid' key is not a dictionary."""
         config = {
-            "field1": {"start": 0, "width": 4, "type": "uint", "valid": "not a dict"},
+            "field1": {**_BASE_FIELD, "valid": "not a dict"},
         }
         with self.assertRaises(ValueError):
             bitdict_factory(config)
@@ -1571,7 +1606,7 @@ class TestBitDict(unittest.TestCase):
     def test_factory_invalid_valid_key_empty_dict(self):
         """Test that bitdict_factory raises a ValueError when 'valid' key is an empty dictionary."""
         config = {
-            "field1": {"start": 0, "width": 4, "type": "uint", "valid": {}},
+            "field1": {**_BASE_FIELD, "valid": {}},
         }
         with self.assertRaises(ValueError):
             bitdict_factory(config)
@@ -1695,6 +1730,21 @@ class TestBitDict(unittest.TestCase):
         with self.assertRaises(ValueError):
             bitdict_factory(config)
 
+    def test_factory_valid_key_range_endpoints(self):
+        """Test that 'valid' ranges are bounds checked by their first and last values."""
+        config = {
+            "field1": {
+                "start": 0,
+                "width": 48,
+                "type": "uint",
+                "valid": {"range": [(0, 1 << 48, 7), (5, -1, -1)]},
+            },
+        }
+        bitdict_factory(config)  # Far too many values to check one by one
+        config["field1"]["valid"]["range"] = [(0, 1 << 49, 1 << 47)]
+        with self.assertRaisesRegex(ValueError, f"Value {1 << 48} out of range"):
+            bitdict_factory(config)
+
     def test_valid_nested_bitdict(self):
         """Test the valid method with a nested BitDict."""
         config = {
@@ -1924,7 +1974,7 @@ class TestBitDict(unittest.TestCase):
     def test_factory_invalid_description_type(self):
         """Test that bitdict_factory raises a ValueError when the description is not a string."""
         config = {
-            "field1": {"start": 0, "width": 4, "type": "uint", "description": 123},
+            "field1": {**_BASE_FIELD, "description": 123},
         }
         with self.assertRaises(ValueError):
             bitdict_factory(config)
@@ -0,0 +1,331 @@
+"""
+Test cases for BitDict class caching, bulk conversion and access paths.
+
+These complement test_bitdict.py: identical configurations sharing a class,
+packing many BitDicts into and out of byte buffers, attribute access and the
+lazily created sub-BitDicts.
+"""
+
+import gc
+import unittest
+import weakref
+
+from bitdict import bitdict_factory
+
+# A valid 4-bit uint field.
+_BASE_FIELD = {"start": 0, "width": 4, "type": "uint"}
+
+
+class TestBitDictFactoryCache(unittest.TestCase):
+    """Unit tests for bitdict_factory class creation and caching."""
+
+    def test_factory_empty_config(self) -> None:
+        """Tests that an empty configuration creates a usable zero width class."""
+        EmptyBitDict = bitdict_factory({}, "EmptyBitDict")
+        bd = EmptyBitDict(0)
+        self.assertEqual(bd.to_int(), 0)
+        self.assertEqual(len(bd), 0)
+        self.assertEqual(bd.to_bytes(), b"")
+        self.assertEqual(bd.to_json(), {})
+        self.assertEqual(bd.to_tuple(), ())
+        self.assertTrue(bd.valid())
+        with self.assertRaises(ValueError):
+            EmptyBitDict(1)
+        with self.assertRaises(ValueError):
+            EmptyBitDict(-1)
+
+    def test_factory_cached_class(self) -> None:
+        """
+        Tests that identical configurations return the same class and that the
+        caller's configuration is normalised on a cache hit.
+        """
+        config1 = {"field1": {"start": 0, "width": 4, "type": "uint", "default": 1}}
+        config2 = {"field1": {"start": 0, "width": 4, "type": "uint", "default": 1}}
+        MyBitDict = bitdict_factory(config1, "CachedBitDict")
+        self.assertIs(bitdict_factory(config2, "CachedBitDict"), MyBitDict)
+        self.assertEqual(config2, config1)
+        self.assertIsNot(bitdict_factory(config2, "OtherBitDict"), MyBitDict)
+        config3 = {"field1": {"start": 0, "width": 4, "type": "uint", "default": True}}
+        self.assertIsNot(bitdict_factory(config3, "CachedBitDict"), MyBitDict)
+
+    def test_factory_cached_class_same_dict(self) -> None:
+        """
+        Tests that passing the same dictionary again returns the same class,
+        although the first call normalised it in place.
+        """
+        config = {"field1": {"start": 0, "width": 4, "type": "uint"}}
+        MyBitDict = bitdict_factory(config, "SameDictBitDict")
+        for _ in range(3):
+            self.assertIs(bitdict_factory(config, "SameDictBitDict"), MyBitDict)
+
+    def test_factory_shared_subtype_class(self) -> None:
+        """Tests that identical subtypes of a property share one class."""
+        sub = {"PropA": {"start": 0, "width": 2, "type": "uint"}}
+        config = {
+            "Mode": {"start": 4, "width": 1, "type": "bool"},
+            "SubValue": {
+                "start": 0,
+                "width": 2,
+                "type": "bitdict",
+                "selector": "Mode",
+                "subtype": [sub, sub],
+            },
+        }
+        MyBitDict = bitdict_factory(config, "SharedSubBitDict")
+        subtypes = MyBitDict.subtypes["SubValue"]
+        self.assertIs(subtypes[0], subtypes[1])
+        # Each selection still has its own sub-BitDict.
+        bd = MyBitDict(0x13)
+        bd["Mode"] = False
+        bd["SubValue"]["PropA"] = 1
+        bd["Mode"] = True
+        self.assertEqual(bd.to_int(), 0x13)
+
+    def test_factory_cache_tags_tuple_items(self) -> None:
+        """
+        Tests that a cached class is not returned for a configuration that only
+        differs in the type of a value inside a tuple, which must be validated.
+        """
+        MyBitDict = bitdict_factory(
+            {"field1": {**_BASE_FIELD, "valid": {"range": [(0, 5)]}}}, "TupleBitDict"
+        )
+        self.assertIs(
+            bitdict_factory(
+                {"field1": {**_BASE_FIELD, "valid": {"range": [(0, 5)]}}},
+                "TupleBitDict",
+            ),
+            MyBitDict,
+        )
+        with self.assertRaises(TypeError):
+            bitdict_factory(
+                {"field1": {**_BASE_FIELD, "valid": {"range": [(0.0, 5)]}}},
+                "TupleBitDict",
+            )
+
+    def test_factory_cache_is_weak(self) -> None:
+        """Tests that the factory cache does not keep unused classes alive."""
+        config = {"field1": {"start": 0, "width": 5, "type": "uint"}}
+        MyBitDict = bitdict_factory(config, "WeaklyCachedBitDict")
+        self.assertIs(bitdict_factory(config, "WeaklyCachedBitDict"), MyBitDict)
+        class_ref = weakref.ref(MyBitDict)
+        del MyBitDict
+        gc.collect()
+        self.assertIsNone(class_ref())
+
+
+class TestBitDictBulk(unittest.TestCase):
+    """Unit tests for bulk conversion and access paths of a BitDict class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the MyBitDict class of test_bitdict.TestBitDict once for all tests."""
+        cls.my_bitdict = bitdict_factory(
+            {
+                "Constant": {"start": 7, "width": 1, "type": "bool"},
+                "Mode": {"start": 6, "width": 1, "type": "bool"},
+                "Reserved": {"start": 4, "width": 2, "type": "uint"},
+                "SubValue": {
+                    "start": 0,
+                    "width": 4,
+                    "type": "bitdict",
+                    "selector": "Mode",
+                    "subtype": [
+                        {
+                            "PropA": {
+                                "start": 0,
+                                "width": 2,
+                                "type": "uint",
+                                "default": 0,
+                            },
+                            "PropB": {
+                                "start": 2,
+                                "width": 2,
+                                "type": "int",
+                                "default": -1,
+                            },
+                        },
+                        {
+                            "PropC": {
+                                "start": 0,
+                                "width": 3,
+                                "type": "uint",
+                                "default": 1,
+                            },
+                            "PropD": {
+                                "start": 3,
+                                "width": 1,
+                                "type": "bool",
+                                "default": True,
+                            },
+                        },
+                    ],
+                },
+            },
+            name="MyBitDict",
+        )
+
+    def test_create_instance_bytes_selector_change(self):
+        """Test that an instance created from bytes behaves as one created from
+        the same integer when the selector changes."""
+        for value in (0x7E, b"\x7e"):
+            with self.subTest(value=value):
+                bd = self.my_bitdict(value)
+                bd["Mode"] = False
+                self.assertEqual(bd.to_int(), 0x3C)
+                bd = self.my_bitdict(value)
+                bd.set({"Constant": 0})
+                self.assertEqual(bd.to_int(), 0xC)
+
+    def test_lazy_subbitdicts(self):
+        """Test that sub-BitDicts are created from the parent value when first used."""
+        bd = self.my_bitdict(0x03)
+        self.assertIsNone(bd._subs)
+        bd.set(0x01)
+        self.assertIsNone(bd._subs)
+        self.assertEqual(bd["SubValue"]["PropA"], 1)
+        # The previously selected sub-BitDict keeps its value.
+        bd["Mode"] = True
+        self.assertEqual(bd["SubValue"]["PropC"], 1)
+        bd["SubValue"]["PropC"] = 5
+        bd["Mode"] = False
+        self.assertEqual(bd.to_int(), 0x01)
+        bd["Mode"] = True
+        self.assertEqual(bd.to_int(), 0x4D)
+
+    def test_narrow_subbitdict_value(self):
+        """Test that a value the selected sub-BitDict cannot hold is rejected when
+        it is set, not when the sub-BitDict is first used."""
+        config = {
+            "Mode": {"start": 4, "width": 1, "type": "bool"},
+            "SubValue": {
+                "start": 0,
+                "width": 4,
+                "type": "bitdict",
+                "selector": "Mode",
+                "subtype": [
+                    {
+                        "Inner": {"start": 3, "width": 1, "type": "bool"},
+                        "Nested": {
+                            "start": 0,
+                            "width": 3,
+                            "type": "bitdict",
+                            "selector": "Inner",
+                            "subtype": [
+                                {"PropA": {"start": 0, "width": 1, "type": "uint"}},
+                                {"PropB": {"start": 0, "width": 3, "type": "uint"}},
+                            ],
+                        },
+                    },
+                    {"PropC": {"start": 0, "width": 2, "type": "uint"}},
+                ],
+            },
+        }
+        NarrowBitDict = bitdict_factory(config, "NarrowBitDict")
+        self.assertEqual(NarrowBitDict(0x0F).to_int(), 0x0F)
+        self.assertEqual(NarrowBitDict(0x13).to_int(), 0x13)
+        for value in (0x1F, 0x03):  # PropC and, nested, PropA overflow.
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    NarrowBitDict(value)
+                with self.assertRaises(ValueError):
+                    NarrowBitDict(value.to_bytes(1, "big"))
+                bd = NarrowBitDict()
+                with self.assertRaises(ValueError):
+                    bd.set(value)
+                self.assertEqual(bd.to_int(), 0)
+
+    def test_to_tuple(self):
+        """Test that to_tuple returns the values __iter__ yields, in the same order."""
+        for value in (0x00, 0x8C, 0x4B, 0xFF):
+            bd = self.my_bitdict(value)
+            values = bd.to_tuple()
+            self.assertEqual(values, tuple(v for _, v in bd))
+            self.assertIs(values[0], bd["SubValue"])
+        self.assertEqual(self.my_bitdict(0xB7).to_tuple()[1:], (3, False, True))
+
+    def test_attribute_access(self):
+        """Test that properties are also accessible as attributes."""
+        bd = self.my_bitdict(0x8C)
+        self.assertEqual(bd.Constant, True)
+        self.assertEqual(bd.SubValue.PropB, -1)
+        bd.Reserved = 2
+        self.assertEqual(bd["Reserved"], 2)
+        bd.SubValue.PropA = 1
+        self.assertEqual(bd.to_int(), 0xAD)
+        with self.assertRaises(ValueError):
+            bd.Reserved = 4
+        config = {"title": {"start": 0, "width": 4, "type": "uint"}}
+        titled = bitdict_factory(config, title="Titled")(3)
+        self.assertEqual(titled.title, "Titled")  # Class attribute wins
+        self.assertEqual(titled["title"], 3)
+
+    def test_bytes_array(self):
+        """Test packing BitDicts into and out of a buffer of records."""
+        bds = [self.my_bitdict(0x8C), self.my_bitdict(0x00), self.my_bitdict(0xC5)]
+        buf = self.my_bitdict.to_bytes_array(bds)
+        self.assertEqual(buf, b"\x8c\x00\xc5")
+        decoded = self.my_bitdict.from_bytes_array(buf)
+        self.assertEqual([bd.to_int() for bd in decoded], [0x8C, 0x00, 0xC5])
+        self.assertEqual(decoded[2]["SubValue"]["PropC"], 5)
+        self.assertEqual(len(self.my_bitdict.from_bytes_array(bytearray(buf), 2)), 2)
+        with self.assertRaises(ValueError):
+            self.my_bitdict.from_bytes_array(buf, 4)
+        with self.assertRaises(TypeError):
+            self.my_bitdict.to_bytes_array([bds[0], 1])
+        wide = bitdict_factory({"Value": {"start": 0, "width": 20, "type": "uint"}})
+        buf = wide.to_bytes_array([wide(0x12345), wide(0xFFFFF)])
+        self.assertEqual(buf, b"\x01\x23\x45\x0f\xff\xff")
+        self.assertEqual(wide.ints_from_bytes_array(buf), [0x12345, 0xFFFFF])
+        self.assertEqual(self.my_bitdict.to_bytes_array([]), b"")
+        padded = b"\x8c\xff\x00\xff\xc5"
+        self.assertEqual(
+            self.my_bitdict.ints_from_bytes_array(padded, stride=2), [0x8C, 0x00, 0xC5]
+        )
+        self.assertEqual(self.my_bitdict.ints_from_bytes_array(b""), [])
+        with self.assertRaises(ValueError):
+            self.my_bitdict.ints_from_bytes_array(padded, 4, stride=2)
+        with self.assertRaises(ValueError):
+            self.my_bitdict.ints_from_bytes_array(padded, stride=0)
+        with self.assertRaises(ValueError):
+            self.my_bitdict.ints_from_bytes_array(padded, -1)
+        narrow = bitdict_factory({"Value": {"start": 0, "width": 12, "type": "uint"}})
+        self.assertEqual(narrow.ints_from_bytes_array(b"\x0f\xff"), [0xFFF])
+        with self.assertRaises(ValueError):
+            narrow.ints_from_bytes_array(b"\x0f\xff\xff\xff")
+        with self.assertRaises(ValueError):
+            narrow.from_bytes_array(b"\xff\xff")
+
+    def test_ints_from_bytes_array_zero_width(self):
+        """Test decoding records of a zero width class, which take no bytes."""
+        empty = bitdict_factory({}, "EmptyBitDict")
+        self.assertEqual(empty.ints_from_bytes_array(b""), [])
+        self.assertEqual(empty.ints_from_bytes_array(b"", 3), [0, 0, 0])
+        with self.assertRaises(ValueError):
+            empty.ints_from_bytes_array(b"", 3, stride=0)
+        with self.assertRaises(ValueError):
+            empty.ints_from_bytes_array(b"", -1)
+
+    def test_from_bytes_array_zero_width(self):
+        """Test creating BitDicts of a zero width class from an empty buffer."""
+        empty = bitdict_factory({}, "EmptyBitDict")
+        bds = empty.from_bytes_array(b"", count=3)
+        self.assertEqual([bd.to_int() for bd in bds], [0, 0, 0])
+        self.assertEqual(len({id(bd) for bd in bds}), 3)
+        self.assertEqual(empty.to_bytes_array(bds), b"")
+        self.assertEqual(empty.from_bytes_array(b""), [])
+        with self.assertRaises(ValueError):
+            empty.from_bytes_array(b"", 3, stride=0)
+
+    def test_extract_field(self):
+        """Test extracting one property from many integer values."""
+        values = [0x8C, 0x00, 0xF5]
+        self.assertEqual(
+            self.my_bitdict.extract_field(values, "Constant"), [True, False, True]
+        )
+        self.assertEqual(self.my_bitdict.extract_field(values, "Reserved"), [0, 0, 3])
+        int_bd = bitdict_factory({"Value": {"start": 2, "width": 4, "type": "int"}})
+        self.assertEqual(int_bd.extract_field([0x1C, 0x20, 0x3C], "Value"), [7, -8, -1])
+        with self.assertRaises(KeyError):
+            self.my_bitdict.extract_field(values, "Missing")
+        with self.assertRaises(ValueError):
+            self.my_bitdict.extract_field(values, "SubValue")
@@ -5,40 +5,81 @@ Unit tests for the markdown module.
 import unittest
 from bitdict import generate_markdown_tables, bitdict_factory
 
+# Baseline two-field configuration. bitdict_factory fills in defaults in place,
+# so tests pass it copies or per-field overlays, never this dict itself.
+_SIMPLE_CFG = {
+    "field1": {"start": 0, "width": 4, "type": "uint"},
+    "field2": {"start": 4, "width": 1, "type": "bool"},
+}
+
 
 class TestMarkdown(unittest.TestCase):
     """
     Unit tests for the config_to_markdown function.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the bitdict classes shared by the include_types variants."""
+        cls.simple_bitdict = bitdict_factory(
+            {name: dict(field) for name, field in _SIMPLE_CFG.items()}
+        )
+        cls.undefined_bitdict = bitdict_factory(
+            {
+                "field1": {**_SIMPLE_CFG["field1"], "start": 2},
+                "field2": {**_SIMPLE_CFG["field2"], "start": 7},
+            }
+        )
+
+    def assert_rows(self, bitdict_class, include_types, rows):
+        """Assert the single table generated for bitdict_class contains rows."""
+        markdown_tables = generate_markdown_tables(
+            bitdict_class, include_types=include_types
+        )
+        self.assertEqual(len(markdown_tables), 1)
+        lines = set(markdown_tables[0].splitlines())
+        for row in rows:
+            self.assertIn(row, lines)
+
     def test_config_to_markdown_simple(self):
         """
-        Test config_to_markdown with a simple configuration.
+        Test config_to_markdown with a simple configuration, with and without types.
         """
-        config = {
-            "field1": {"start": 0, "width": 4, "type": "uint"},
-            "field2": {"start": 4, "width": 1, "type": "bool"},
-        }
-        markdown_tables = generate_markdown_tables(bitdict_factory(config))
-        self.assertEqual(len(markdown_tables), 1)
-        self.assertTrue(
-            "| Name | Type | Bitfield | Default | Description |" in markdown_tables[0]
+        cases = (
+            (
+                True,
+                (
+                    "| Name | Type | Bitfield | Default | Description |",
+                    "| field1 | uint | 3:0 | 0 |  |",
+                    "| field2 | bool | 4 | False |  |",
+                ),
+            ),
+            (
+                False,
+                (
+                    "| Name | Bitfield | Default | Description |",
+                    "| field1 | 3:0 | 0 |  |",
+                    "| field2 | 4 | False |  |",
+                ),
+            ),
         )
-        self.assertTrue("| field1 | uint | 3:0 | 0 |  |" in markdown_tables[0])
-        self.assertTrue("| field2 | bool | 4 | False |  |" in markdown_tables[0])
+        for include_types, rows in cases:
+            with self.subTest(include_types=include_types):
+                self.assert_rows(self.simple_bitdict, include_types, rows)
 
     def test_config_to_markdown_with_defaults(self):
         """
         Test config_to_markdown with default values.
         """
         config = {
-            "field1": {"start": 0, "width": 4, "type": "uint", "default": 5},
-            "field2": {"start": 4, "width": 1, "type": "bool", "default": True},
+            "field1": {**_SIMPLE_CFG["field1"], "default": 5},
+            "field2": {**_SIMPLE_CFG["field2"], "default": True},
         }
         markdown_tables = generate_markdown_tables(bitdict_factory(config))
         self.assertEqual(len(markdown_tables), 1)
-        self.assertTrue("| field1 | uint | 3:0 | 5 |  |" in markdown_tables[0])
-        self.assertTrue("| field2 | bool | 4 | True |  |" in markdown_tables[0])
+        lines = set(markdown_tables[0].splitlines())
+        self.assertIn("| field1 | uint | 3:0 | 5 |  |", lines)
+        self.assertIn("| field2 | bool | 4 | True |  |", lines)
 
     def test_config_to_markdown_with_valid(self):
         """
@@ -60,14 +101,9 @@ class TestMarkdown(unittest.TestCase):
         }
         markdown_tables = generate_markdown_tables(bitdict_factory(config))
         self.assertEqual(len(markdown_tables), 1)
-        self.assertTrue(
-            "| field1 | uint | 3:0 | 0 | Valid values: {1, 2, 3}.  |"
-            in markdown_tables[0]
-        )
-        self.assertTrue(
-            "| field2 | bool | 4 | False | Valid values: {True}.  |"
-            in markdown_tables[0]
-        )
+        lines = set(markdown_tables[0].splitlines())
+        self.assertIn("| field1 | uint | 3:0 | 0 | Valid values: {1, 2, 3}.  |", lines)
+        self.assertIn("| field2 | bool | 4 | False | Valid values: {True}.  |", lines)
 
     def test_config_to_markdown_with_bitdict(self):
         """
@@ -85,58 +121,37 @@ class TestMarkdown(unittest.TestCase):
         }
         markdown_tables = generate_markdown_tables(bitdict_factory(config))
         self.assertEqual(len(markdown_tables), 2)
-        self.assertTrue(
-            "| field2 | bitdict | 7:4 | N/A | See 'field2' definition table(s). |"
-            in markdown_tables[0]
-        )
-
-    def test_config_to_markdown_without_types(self):
-        """
-        Test config_to_markdown without types.
-        """
-        config = {
-            "field1": {"start": 0, "width": 4, "type": "uint"},
-            "field2": {"start": 4, "width": 1, "type": "bool"},
-        }
-        markdown_tables = generate_markdown_tables(
-            bitdict_factory(config), include_types=False
+        lines = set(markdown_tables[0].splitlines())
+        self.assertIn(
+            "| field2 | bitdict | 7:4 | N/A | See 'field2' definition table(s). |",
+            lines,
         )
-        self.assertEqual(len(markdown_tables), 1)
-        self.assertTrue(
-            "| Name | Bitfield | Default | Description |" in markdown_tables[0]
-        )
-        self.assertTrue("| field1 | 3:0 | 0 |  |" in markdown_tables[0])
-        self.assertTrue("| field2 | 4 | False |  |" in markdown_tables[0])
 
     def test_config_to_markdown_undefined_bits(self):
         """
-        Test config_to_markdown with undefined bits.
-        """
-        config = {
-            "field1": {"start": 2, "width": 4, "type": "uint"},
-            "field2": {"start": 7, "width": 1, "type": "bool"},
-        }
-        markdown_tables = generate_markdown_tables(bitdict_factory(config))
-        self.assertEqual(len(markdown_tables), 1)
-        self.assertTrue("| Undefined | N/A | 0-1 | N/A | N/A |" in markdown_tables[0])
-        self.assertTrue("| field1 | uint | 5:2 | 0 |  |" in markdown_tables[0])
-        self.assertTrue("| field2 | bool | 7 | False |  |" in markdown_tables[0])
-
-    def test_config_to_markdown_undefined_bits_no_types(self):
-        """
-        Test config_to_markdown with undefined bits.
+        Test config_to_markdown with undefined bits, with and without types.
         """
-        config = {
-            "field1": {"start": 2, "width": 4, "type": "uint"},
-            "field2": {"start": 7, "width": 1, "type": "bool"},
-        }
-        markdown_tables = generate_markdown_tables(
-            bitdict_factory(config), include_types=False
+        cases = (
+            (
+                True,
+                (
+                    "| Undefined | N/A | 0-1 | N/A | N/A |",
+                    "| field1 | uint | 5:2 | 0 |  |",
+                    "| field2 | bool | 7 | False |  |",
+                ),
+            ),
+            (
+                False,
+                (
+                    "| Undefined | 0-1 | N/A | N/A |",
+                    "| field1 | 5:2 | 0 |  |",
+                    "| field2 | 7 | False |  |",
+                ),
+            ),
         )
-        self.assertEqual(len(markdown_tables), 1)
-        self.assertTrue("| Undefined | 0-1 | N/A | N/A |" in markdown_tables[0])
-        self.assertTrue("| field1 | 5:2 | 0 |  |" in markdown_tables[0])
-        self.assertTrue("| field2 | 7 | False |  |" in markdown_tables[0])
+        for include_types, rows in cases:
+            with self.subTest(include_types=include_types):
+                self.assert_rows(self.undefined_bitdict, include_types, rows)
 
     def test_config_to_markdown_valid_range(self):
         """
@@ -152,9 +167,9 @@ class TestMarkdown(unittest.TestCase):
         }
         markdown_tables = generate_markdown_tables(bitdict_factory(config))
         self.assertEqual(len(markdown_tables), 1)
-        self.assertTrue(
-            "| field1 | uint | 3:0 | 0 | Valid ranges: [(0, 5), (7, 8)].  |"
-            in markdown_tables[0]
+        lines = set(markdown_tables[0].splitlines())
+        self.assertIn(
+            "| field1 | uint | 3:0 | 0 | Valid ranges: [(0, 5), (7, 8)].  |", lines
         )
 
     def test_config_to_markdown_complex(self):
@@ -242,8 +257,9 @@ class TestMarkdown(unittest.TestCase):
         }
         markdown_tables = generate_markdown_tables(bitdict_factory(config))
         self.assertEqual(len(markdown_tables), 7)
-        self.assertTrue("| Selector1 | bool | 0 | False |  |" in markdown_tables[0])
-        self.assertTrue(
-            "| BitDict1 | bitdict | 3:1 | N/A | See 'BitDict1' definition table(s). |"
-            in markdown_tables[0]
+        lines = set(markdown_tables[0].splitlines())
+        self.assertIn("| Selector1 | bool | 0 | False |  |", lines)
+        self.assertIn(
+            "| BitDict1 | bitdict | 3:1 | N/A | See 'BitDict1' definition table(s). |",
+            lines,
         )